@@ -4,6 +4,8 @@
 import sys
 import os
 import io
+import gzip
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 # Windowsのコンソールエンコーディング問題を回避
 if sys.platform == 'win32':
@@ -21,50 +23,207 @@ from src.pages.jp_medium import JPMediumPage
 from src.pages.jp_long import JPLongPage
 from src.renderer.html_generator import HTMLGenerator
 
+# ページクラス（市場ごとにまとめて1プロセスで生成する）
+PAGES = {
+    "US": [
+        ("short", USShortPage),
+        ("medium", USMediumPage),
+        ("long", USLongPage),
+    ],
+    "JP": [
+        ("short", JPShortPage),
+        ("medium", JPMediumPage),
+        ("long", JPLongPage),
+    ],
+}
+
+# 書き込みの並列数
+MAX_WRITE_WORKERS = 8
+
+# 事前圧縮した .gz も出力するか（gzip_static 等で配信する場合に PRECOMPRESS_GZIP=1 を指定。
+# GitHub Pages は配信時に圧縮するため既定では出力しない）
+PRECOMPRESS_GZIP = os.getenv("PRECOMPRESS_GZIP") == "1"
+
+# ページから読み込むPlotly.js（CDNではなくサイト内に配置する）
+PLOTLY_JS_PATH = "public/assets/js/plotly.min.js"
+
+
+def write_plotly_js(path: str = PLOTLY_JS_PATH) -> bool:
+    """
+    plotlyパッケージに同梱のPlotly.jsをサイト内に配置（内容が同じなら書き込まない）
+    
+    Args:
+        path: 出力先パス
+    
+    Returns:
+        bool: 書き込んだ場合True
+    """
+    from plotly.offline import get_plotlyjs
+    
+    data = get_plotlyjs().encode("utf-8")
+    if os.path.exists(path) and os.path.getsize(path) == len(data):
+        with open(path, "rb") as f:
+            if f.read() == data:
+                if PRECOMPRESS_GZIP and not os.path.exists(path + ".gz"):
+                    _write_gzip(path, [data])
+                return False
+    
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    if PRECOMPRESS_GZIP:
+        _write_gzip(path, [data])
+    return True
+
+
+def _write_file(path: str, chunks: list) -> str:
+    """
+    ファイルを書き込む
+    
+    Args:
+        path: 出力先パス
+        chunks: UTF-8エンコード済みHTML断片のリスト（結合せずに順に書き込む）
+    
+    Returns:
+        str: 出力先パス
+    """
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.writelines(chunks)
+    if PRECOMPRESS_GZIP:
+        _write_gzip(path, chunks)
+    return path
+
+
+def _write_gzip(path: str, chunks: list):
+    """
+    事前圧縮版（path + ".gz"）を書き込む
+    
+    mtimeを0に固定し、内容が同じなら同じバイト列になるようにする
+    
+    Args:
+        path: 元ファイルのパス
+        chunks: UTF-8エンコード済みの断片のリスト
+    """
+    with open(path + ".gz", "wb") as raw:
+        with gzip.GzipFile(filename="", mode="wb", compresslevel=9, fileobj=raw, mtime=0) as f:
+            f.writelines(chunks)
+
+
+def submit_writes(executor: ThreadPoolExecutor, files: list) -> list:
+    """
+    生成したHTMLの書き込みをスレッドプールに投入（ほかの市場の生成と書き込み待ちを重ねる）
+    
+    Args:
+        executor: 書き込み用のスレッドプール
+        files: (出力先パス, UTF-8エンコード済みHTML断片のリスト) のリスト
+    
+    Returns:
+        list: (出力先パス, Future) のリスト
+    """
+    return [(path, executor.submit(_write_file, path, chunks)) for path, chunks in files]
+
+
+def report_writes(write_futures: list):
+    """
+    書き込み結果を待って表示
+    
+    Args:
+        write_futures: (出力先パス, Future) のリスト
+    """
+    for path, future in write_futures:
+        try:
+            future.result()
+            print(f"  [OK] 生成完了: {path}")
+        except Exception as e:
+            print(f"  [NG] 書き込みエラー: {path}: {e}")
+
+
+def build_market_pages(market_code: str, generated_at: str) -> list:
+    """
+    1市場分のページを生成（プロセスプールのワーカーで実行）
+    
+    同じ市場のページは同じデータ・キャッシュファイルを使うため、
+    市場単位で1プロセスにまとめて順番に生成する
+    
+    Args:
+        market_code: 市場コード（"US" or "JP"）
+        generated_at: 生成日時
+    
+    Returns:
+        list: (期間コード, UTF-8エンコード済みHTML断片のリスト, エラー文字列) のリスト（成功時はエラーNone、失敗時はHTML None）
+    """
+    import traceback
+    
+    results = []
+    for timeframe_code, page_class in PAGES[market_code]:
+        print(f"\n{market_code}-{timeframe_code} ページを生成中...")
+        try:
+            page_data = page_class().build()
+            # ページ全体を結合せず、断片のまま書き込みに回す（エンコードもワーカー側で済ませる）
+            chunks = list(HTMLGenerator.iter_page_bytes(page_data, generated_at))
+            results.append((timeframe_code, chunks, None))
+        except Exception as e:
+            results.append((timeframe_code, None, f"{e}\n{traceback.format_exc()}"))
+    return results
+
 
 def build_all_pages():
     """すべてのページを生成"""
     # 出力ディレクトリ作成
     os.makedirs("public/logs", exist_ok=True)
     
-    pages = [
-        ("US", "short", USShortPage()),
-        ("US", "medium", USMediumPage()),
-        ("US", "long", USLongPage()),
-        ("JP", "short", JPShortPage()),
-        ("JP", "medium", JPMediumPage()),
-        ("JP", "long", JPLongPage()),
-    ]
-    
     print("ページ生成を開始します...")
     
-    for market_code, timeframe_code, page in pages:
-        print(f"\n{market_code}-{timeframe_code} ページを生成中...")
+    # 生成日時は全ページで共通の値を使う
+    generated_at = HTMLGenerator.format_generated_at()
+    
+    # 生成できたページから順に書き込みを投入し、残りの市場の生成と重ねる
+    with ThreadPoolExecutor(max_workers=MAX_WRITE_WORKERS) as writer, \
+            ProcessPoolExecutor(max_workers=min(len(PAGES), os.cpu_count() or 1)) as executor:
+        # Plotly.js配置（ページ生成と無関係なので先に投入）
+        plotly_future = writer.submit(write_plotly_js)
+        write_futures = []
+        
+        # 市場ごとに別プロセスで並列生成
+        futures = {
+            executor.submit(build_market_pages, market_code, generated_at): market_code
+            for market_code in PAGES
+        }
+        for future in as_completed(futures):
+            market_code = futures[future]
+            try:
+                results = future.result()
+            except Exception as e:
+                print(f"  [NG] {market_code} エラー: {e}")
+                continue
+            files = []
+            for timeframe_code, chunks, error in results:
+                if error is not None:
+                    print(f"  [NG] {market_code}-{timeframe_code} エラー: {error}")
+                    continue
+                filename = f"public/logs/{market_code}-{timeframe_code}.html"
+                files.append((filename, chunks))
+            write_futures.extend(submit_writes(writer, files))
+        
+        # インデックスページ生成
+        print("\nインデックスページを生成中...")
         try:
-            page_data = page.build()
-            html = HTMLGenerator.generate_page_html(page_data)
-            
-            filename = f"public/logs/{market_code}-{timeframe_code}.html"
-            with open(filename, "w", encoding="utf-8") as f:
-                f.write(html)
-            
-            print(f"  [OK] 生成完了: {filename}")
+            index_html = HTMLGenerator.generate_index_html(generated_at)
+            write_futures.extend(submit_writes(writer, [("public/index.html", [index_html.encode("utf-8")])]))
         except Exception as e:
             print(f"  [NG] エラー: {e}")
             import traceback
             traceback.print_exc()
-    
-    # インデックスページ生成
-    print("\nインデックスページを生成中...")
-    try:
-        index_html = HTMLGenerator.generate_index_html()
-        with open("public/index.html", "w", encoding="utf-8") as f:
-            f.write(index_html)
-        print("  [OK] 生成完了: public/index.html")
-    except Exception as e:
-        print(f"  [NG] エラー: {e}")
-        import traceback
-        traceback.print_exc()
+        
+        # ファイル書き込み結果
+        print("\nファイルを書き込み中...")
+        report_writes(write_futures)
+        
+        try:
+            if plotly_future.result():
+                print(f"  [OK] 配置完了: {PLOTLY_JS_PATH}")
+        except Exception as e:
+            print(f"  [NG] Plotly.js配置エラー: {e}")
     
     print("\nページ生成が完了しました。")
 
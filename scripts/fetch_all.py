@@ -12,30 +12,26 @@ if sys.platform == 'win32':
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-import yaml
 from datetime import datetime, timedelta
 from src.fetchers.price_fetcher import PriceFetcher
 from src.fetchers.rate_fetcher import RateFetcher
 from src.fetchers.cpi_fetcher import CPIFetcher
 from src.fetchers.eps_per_fetcher import EPSPERFetcher
+from src.pages.config_loader import load_yaml_config
 
 
 def fetch_all_data():
     """すべてのデータを取得"""
     # 設定読み込み
-    with open("config/markets.yaml", "r", encoding="utf-8") as f:
-        markets_config = yaml.safe_load(f)
+    markets_config = load_yaml_config("config/markets.yaml")
     
     markets = markets_config["markets"]
     
     print("データ取得を開始します...")
     
+    # 株価指数は全市場分を1回のリクエストでまとめて取得
+    price_symbols = {}
     for market in markets:
-        market_code = market["code"]
-        market_name = market["name"]
-        print(f"\n{market_name} ({market_code}) のデータを取得中...")
-        
-        # 株価指数
         price_index = market.get("price_index")
         if price_index:
             symbol_config = next(
@@ -43,41 +39,53 @@ def fetch_all_data():
                 None
             )
             if symbol_config:
-                symbol = symbol_config["symbol"]
-                print(f"  株価指数 ({price_index}): {symbol}")
-                try:
-                    fetcher = PriceFetcher(market_code, symbol)
-                    data = fetcher.fetch()
-                    if not data.empty:
-                        print(f"    [OK] 取得完了: {len(data)}件")
-                    else:
-                        print(f"    [NG] データが取得できませんでした")
-                except Exception as e:
-                    print(f"    [NG] エラー: {e}")
+                price_symbols[market["code"]] = symbol_config["symbol"]
+    
+    try:
+        price_results = PriceFetcher.fetch_many(list(price_symbols.values()))
+    except Exception as e:
+        print(f"株価指数の一括取得エラー: {e}")
+        price_results = {}
+    
+    # 金利は全市場分をスレッドで並列取得
+    rate_types = [("policy", "政策金利"), ("long_10y", "長期金利（10年）")]
+    try:
+        rate_results = RateFetcher.fetch_many(
+            [(market["code"], rate_type) for market in markets for rate_type, _ in rate_types]
+        )
+        rate_error = None
+    except Exception as e:
+        rate_results = {}
+        rate_error = e
+    
+    for market in markets:
+        market_code = market["code"]
+        market_name = market["name"]
+        print(f"\n{market_name} ({market_code}) のデータを取得中...")
         
-        # 政策金利
-        print(f"  政策金利")
-        try:
-            fetcher = RateFetcher(market_code, "policy")
-            data = fetcher.fetch()
-            if not data.empty:
+        # 株価指数
+        price_index = market.get("price_index")
+        symbol = price_symbols.get(market_code)
+        if symbol:
+            print(f"  株価指数 ({price_index}): {symbol}")
+            data = price_results.get(symbol)
+            if data is not None and not data.empty:
+                PriceFetcher(market_code, symbol).save_raw_data(data, "price")
                 print(f"    [OK] 取得完了: {len(data)}件")
             else:
                 print(f"    [NG] データが取得できませんでした")
-        except Exception as e:
-            print(f"    [NG] エラー: {e}")
         
-        # 長期金利
-        print(f"  長期金利（10年）")
-        try:
-            fetcher = RateFetcher(market_code, "long_10y")
-            data = fetcher.fetch()
-            if not data.empty:
+        # 政策金利・長期金利
+        for rate_type, rate_label in rate_types:
+            print(f"  {rate_label}")
+            if rate_error is not None:
+                print(f"    [NG] エラー: {rate_error}")
+                continue
+            data = rate_results.get((market_code, rate_type))
+            if data is not None and not data.empty:
                 print(f"    [OK] 取得完了: {len(data)}件")
             else:
                 print(f"    [NG] データが取得できませんでした")
-        except Exception as e:
-            print(f"    [NG] エラー: {e}")
         
         # CPI
         print(f"  CPI（消費者物価指数）")
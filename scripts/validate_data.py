@@ -13,8 +13,8 @@ if sys.platform == 'win32':
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 import os
-import pandas as pd
 from src.processors.validator import DataValidator
+from src.fetchers.base_fetcher import read_table
 
 
 def validate_data():
@@ -33,14 +33,12 @@ def validate_data():
             continue
         
         for data_type in data_types:
-            filepath = os.path.join(raw_dir, f"{data_type}.csv")
-            
-            if not os.path.exists(filepath):
-                print(f"  [NG] {data_type}: ファイルが存在しません")
-                continue
-            
             try:
-                df = pd.read_csv(filepath, index_col=0, parse_dates=True)
+                # parquet（pyarrowがある場合）またはCSVを読み込む
+                df = read_table(os.path.join(raw_dir, data_type))
+                if df is None:
+                    print(f"  [NG] {data_type}: ファイルが存在しません")
+                    continue
                 
                 validator = DataValidator()
                 
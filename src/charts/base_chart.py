@@ -2,11 +2,92 @@
 ベースチャートクラス
 """
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from datetime import date
+from typing import Optional, Dict, Any, List, Callable
+import functools
+import hashlib
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+# 複数期間チャートデータのキャッシュ
+# （同じデータを複数ページで描画する場合に再生成しない）
+CONTENT_CACHE_SIZE = 64
+
+# 描画先divの既定の高さ（px。layout.heightがない場合）
+DEFAULT_CHART_HEIGHT = 400
+
+# チャートデータに埋め込む値の小数桁数
+# （データはfloat32で格納しているため、float64に戻して丸め、2.569999933... のような誤差を出さない）
+CHART_VALUE_DECIMALS = 2
+_CONTENT_CACHE: "OrderedDict[bytes, Any]" = OrderedDict()
+
+
+def _update_digest(h: "hashlib.blake2b", value: Any):
+    """
+    キャッシュキー用に値の内容をハッシュへ追加
+    
+    Args:
+        h: ハッシュオブジェクト
+        value: 追加する値（DataFrameは値・インデックス・カラムを使用）
+    """
+    if isinstance(value, pd.DataFrame):
+        h.update(repr((list(value.columns), [str(dtype) for dtype in value.dtypes], str(value.index.dtype))).encode("utf-8"))
+        # 行ごとのハッシュ（インデックス込み）。タイムゾーン付きの日付やobject型のカラムも扱える
+        h.update(pd.util.hash_pandas_object(value, index=True).to_numpy().view(np.uint8))
+    else:
+        h.update(repr(value).encode("utf-8"))
+    h.update(b"\x00")
+
+
+def content_cached(method: Callable) -> Callable:
+    """
+    チャートのメソッドの結果を入力内容のハッシュでキャッシュするデコレータ
+    
+    キーはチャートクラス・メソッド名・チャートの属性（fig以外）・当日日付・引数の内容。
+    返り値はキャッシュと共有されるため、呼び出し側で変更しないこと。
+    
+    Args:
+        method: create_multi_period_data
+    
+    Returns:
+        Callable: キャッシュ付きのメソッド
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            h = hashlib.blake2b(digest_size=16)
+            h.update(type(self).__name__.encode("utf-8"))
+            _update_digest(h, method.__name__)
+            _update_digest(h, sorted((k, v) for k, v in vars(self).items() if k != "fig"))
+            # 期間の切り出しは実行日基準のため日付もキーに含める
+            _update_digest(h, date.today().isoformat())
+            for arg in args:
+                _update_digest(h, arg)
+            for key in sorted(kwargs):
+                _update_digest(h, key)
+                _update_digest(h, kwargs[key])
+            cache_key = h.digest()
+        except Exception as e:
+            # キーを作れない入力はキャッシュを使わずにそのまま生成する
+            print(f"チャートキャッシュのキー生成エラー ({type(self).__name__}.{method.__name__}): {e}")
+            return method(self, *args, **kwargs)
+        
+        cached = _CONTENT_CACHE.get(cache_key)
+        if cached is not None:
+            _CONTENT_CACHE.move_to_end(cache_key)
+            return cached
+        
+        result = method(self, *args, **kwargs)
+        _CONTENT_CACHE[cache_key] = result
+        if len(_CONTENT_CACHE) > CONTENT_CACHE_SIZE:
+            _CONTENT_CACHE.popitem(last=False)
+        return result
+    
+    return wrapper
+
 
 class BaseChart(ABC):
     """チャートの基底クラス"""
@@ -48,43 +129,52 @@ class BaseChart(ABC):
         """
         pass
     
-    def to_html(self, fig: Optional[go.Figure] = None, chart_id: Optional[str] = None) -> str:
+    @staticmethod
+    def to_chart_values(values: pd.Series) -> List[Optional[float]]:
         """
-        チャートをHTMLに変換（憲法準拠：初期表示用divのみ生成、Plotly.newPlotは1回だけ）
+        チャートデータ用の値のリストに変換（float64に戻してCHART_VALUE_DECIMALS桁に丸める）
         
         Args:
-            fig: Figureオブジェクト（Noneの場合はself.figを使用）
-            chart_id: チャートID（指定されない場合は自動生成）
+            values: 値のSeries（float32でもよい）
         
         Returns:
-            str: HTML文字列（div要素のみ、Plotly.newPlotのscriptは含まない）
+            List[Optional[float]]: 値のリスト（欠損はNaNのまま）
         """
-        if chart_id is None:
-            chart_id = f"chart_{id(self)}"
+        return np.round(values.to_numpy(dtype=np.float64), CHART_VALUE_DECIMALS).tolist()
+    
+    @staticmethod
+    def get_initial_height(multi_period_data: Dict[int, Dict[str, Any]]) -> int:
+        """
+        初期表示する期間（最短の期間）のlayout.heightを取得
+        
+        Args:
+            multi_period_data: create_multi_period_dataの結果
         
-        if fig is None:
-            fig = self.fig
+        Returns:
+            int: 高さ（px。データがない場合は既定値）
+        """
+        if not multi_period_data:
+            return DEFAULT_CHART_HEIGHT
+        return multi_period_data[min(multi_period_data)]["layout"].get("height", DEFAULT_CHART_HEIGHT)
+    
+    def to_html(self, chart_id: Optional[str] = None, height: int = DEFAULT_CHART_HEIGHT) -> str:
+        """
+        初期表示用の描画先divを生成（憲法準拠：Plotly.newPlotはページ末尾で1回だけ）
         
-        if fig is None:
-            return f'<div id="{chart_id}" class="plotly-graph-div" style="height:400px; width:100%;"></div>'
+        描画はページ末尾のスクリプトが複数期間データ（create_multi_period_data）から行うため、
+        ここではFigureを使わずdivだけを出力する。
         
-        # Plotlyのto_htmlは完全なHTMLを返すため、div要素のみを抽出
-        html = fig.to_html(include_plotlyjs=False, div_id=chart_id)
+        Args:
+            chart_id: チャートID（指定されない場合は自動生成）
+            height: divの高さ（px。描画時のlayout.heightと合わせる）
         
-        # <html>タグや<head>タグ、<body>タグを削除し、div要素のみを返す
-        import re
-        # <body>タグの中身を抽出
-        body_match = re.search(r'<body[^>]*>(.*?)</body>', html, re.DOTALL)
-        if body_match:
-            body_content = body_match.group(1)
-            # <div>要素のみを抽出（scriptは除外）
-            div_matches = re.findall(r'<div[^>]*>.*?</div>', body_content, re.DOTALL)
-            
-            if div_matches:
-                return div_matches[0]
+        Returns:
+            str: HTML文字列（div要素のみ、Plotly.newPlotのscriptは含まない）
+        """
+        if chart_id is None:
+            chart_id = f"chart_{id(self)}"
         
-        # フォールバック：div要素のみを返す
-        return f'<div id="{chart_id}" class="plotly-graph-div" style="height:400px; width:100%;"></div>'
+        return f'<div id="{chart_id}" class="plotly-graph-div" style="height:{height}px; width:100%;"></div>'
     
     def get_no_data_message(self) -> str:
         """データが取得できない場合のメッセージ"""
@@ -5,7 +5,7 @@ import pandas as pd
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
-from .base_chart import BaseChart
+from .base_chart import BaseChart, content_cached
 
 
 class CPIChart(BaseChart):
@@ -81,6 +81,7 @@ class CPIChart(BaseChart):
         self.fig = fig
         return fig
     
+    @content_cached
     def create_multi_period_data(self, data: pd.DataFrame, periods: List[int]) -> Dict[int, Dict[str, Any]]:
         """
         複数期間のチャートデータを生成（憲法準拠）
@@ -105,9 +106,11 @@ class CPIChart(BaseChart):
         if data.index.tz is not None:
             data.index = data.index.tz_localize(None)
         
+        # 期間の終端は全期間で共通
+        end_date = datetime.now()
+        
         for years in periods:
             # 期間でフィルタリング
-            end_date = datetime.now()
             start_date = end_date - timedelta(days=years * 365)
             filtered_data = data[(data.index >= start_date) & (data.index <= end_date)]
             
@@ -117,7 +120,7 @@ class CPIChart(BaseChart):
             # tracesを生成
             traces = [{
                 "x": filtered_data.index.strftime("%Y-%m-%d").tolist(),
-                "y": filtered_data['CPI_YoY'].tolist(),
+                "y": self.to_chart_values(filtered_data['CPI_YoY']),
                 "mode": "lines+markers",
                 "name": "CPI前年比",
                 "line": {"color": "#2563eb", "width": 2},
@@ -127,9 +130,9 @@ class CPIChart(BaseChart):
             
             # layoutを生成
             layout = {
-                "title": self.title,
-                "xaxis": {"title": "日付"},
-                "yaxis": {"title": "CPI前年比 (%)"},
+                "title": {"text": self.title},
+                "xaxis": {"title": {"text": "日付"}},
+                "yaxis": {"title": {"text": "CPI前年比 (%)"}},
                 "hovermode": "x unified",
                 "height": 400,
                 "margin": {"l": 50, "r": 50, "t": 50, "b": 50},
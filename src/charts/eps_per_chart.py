@@ -6,7 +6,7 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
-from .base_chart import BaseChart
+from .base_chart import BaseChart, content_cached
 
 
 class EPSPERChart(BaseChart):
@@ -130,6 +130,7 @@ class EPSPERChart(BaseChart):
         self.fig = fig
         return fig
     
+    @content_cached
     def create_multi_period_data(self, data: pd.DataFrame, periods: List[int] = None) -> Dict[int, Dict[str, Any]]:
         """
         複数期間のチャートデータを生成（憲法準拠：EPS/PERは20年固定）
@@ -165,12 +166,13 @@ class EPSPERChart(BaseChart):
         if filtered_data.empty:
             return result
         
-        # tracesを生成（サブプロット用）
+        # tracesを生成（サブプロット用、日付軸は1回だけ文字列化する）
         traces = []
+        x_dates = filtered_data.index.strftime("%Y-%m-%d").tolist()
         if has_eps:
             traces.append({
-                "x": filtered_data.index.strftime("%Y-%m-%d").tolist(),
-                "y": filtered_data['EPS'].tolist(),
+                "x": x_dates,
+                "y": self.to_chart_values(filtered_data['EPS']),
                 "mode": "lines+markers",
                 "name": "EPS",
                 "line": {"color": "#2563eb", "width": 2},
@@ -180,8 +182,8 @@ class EPSPERChart(BaseChart):
                 "yaxis": "y"
             })
             traces.append({
-                "x": filtered_data.index.strftime("%Y-%m-%d").tolist(),
-                "y": filtered_data['PER'].tolist(),
+                "x": x_dates,
+                "y": self.to_chart_values(filtered_data['PER']),
                 "mode": "lines+markers",
                 "name": "PER",
                 "line": {"color": "#f59e0b", "width": 2},
@@ -192,8 +194,8 @@ class EPSPERChart(BaseChart):
             })
         else:
             traces.append({
-                "x": filtered_data.index.strftime("%Y-%m-%d").tolist(),
-                "y": filtered_data['PER'].tolist(),
+                "x": x_dates,
+                "y": self.to_chart_values(filtered_data['PER']),
                 "mode": "lines+markers",
                 "name": "PER",
                 "line": {"color": "#f59e0b", "width": 2},
@@ -206,26 +208,26 @@ class EPSPERChart(BaseChart):
         # layoutを生成（サブプロット用）
         if has_eps:
             layout = {
-                "title": self.title,
+                "title": {"text": self.title},
                 "height": 600,
                 "hovermode": "x unified",
                 "margin": {"l": 50, "r": 50, "t": 50, "b": 50},
                 "showlegend": False,
                 "grid": {"rows": 2, "columns": 1, "pattern": "independent"},
-                "xaxis": {"title": "", "domain": [0, 1], "anchor": "y"},
-                "xaxis2": {"title": "日付", "domain": [0, 1], "anchor": "y2"},
-                "yaxis": {"title": "EPS", "domain": [0.55, 1]},
-                "yaxis2": {"title": "PER", "domain": [0, 0.45]}
+                "xaxis": {"title": {"text": ""}, "domain": [0, 1], "anchor": "y"},
+                "xaxis2": {"title": {"text": "日付"}, "domain": [0, 1], "anchor": "y2"},
+                "yaxis": {"title": {"text": "EPS"}, "domain": [0.55, 1]},
+                "yaxis2": {"title": {"text": "PER"}, "domain": [0, 0.45]}
             }
         else:
             layout = {
-                "title": self.title,
+                "title": {"text": self.title},
                 "height": 400,
                 "hovermode": "x unified",
                 "margin": {"l": 50, "r": 50, "t": 50, "b": 50},
                 "showlegend": False,
-                "xaxis": {"title": "日付", "domain": [0, 1], "anchor": "y"},
-                "yaxis": {"title": "PER", "domain": [0, 1]}
+                "xaxis": {"title": {"text": "日付"}, "domain": [0, 1], "anchor": "y"},
+                "yaxis": {"title": {"text": "PER"}, "domain": [0, 1]}
             }
         
         result[20] = {
@@ -5,7 +5,7 @@ import pandas as pd
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
-from .base_chart import BaseChart
+from .base_chart import BaseChart, content_cached
 
 
 class PriceChart(BaseChart):
@@ -115,6 +115,7 @@ class PriceChart(BaseChart):
         self.fig = fig
         return fig
     
+    @content_cached
     def create_multi_period_data(self, data: pd.DataFrame, periods: List[int]) -> Dict[int, Dict[str, Any]]:
         """
         複数期間のチャートデータを生成（憲法準拠）
@@ -139,22 +140,26 @@ class PriceChart(BaseChart):
         if data.index.tz is not None:
             data.index = data.index.tz_localize(None)
         
+        # 期間の終端は全期間で共通
+        end_date = datetime.now()
+        
         for years in periods:
             # 期間でフィルタリング
-            end_date = datetime.now()
             start_date = end_date - timedelta(days=years * 365)
             filtered_data = data[(data.index >= start_date) & (data.index <= end_date)]
             
             if filtered_data.empty:
                 continue
             
-            # tracesを生成
+            # tracesを生成（日付軸は全trace共通なので1回だけ文字列化する）
             traces = []
+            x_dates = filtered_data.index.strftime("%Y-%m-%d").tolist()
+            columns = filtered_data.columns
             
             # 株価（実線）
             traces.append({
-                "x": filtered_data.index.strftime("%Y-%m-%d").tolist(),
-                "y": filtered_data['Close'].tolist(),
+                "x": x_dates,
+                "y": self.to_chart_values(filtered_data['Close']),
                 "mode": "lines",
                 "name": "株価",
                 "line": {"color": "#2563eb", "width": 2},
@@ -162,30 +167,30 @@ class PriceChart(BaseChart):
             })
             
             # 移動平均（波線）
-            if 'MA20' in filtered_data.columns:
+            if 'MA20' in columns:
                 traces.append({
-                    "x": filtered_data.index.strftime("%Y-%m-%d").tolist(),
-                    "y": filtered_data['MA20'].tolist(),
+                    "x": x_dates,
+                    "y": self.to_chart_values(filtered_data['MA20']),
                     "mode": "lines",
                     "name": "MA20",
                     "line": {"color": "#f59e0b", "width": 1, "dash": "dash"},
                     "type": "scatter"
                 })
             
-            if 'MA75' in filtered_data.columns:
+            if 'MA75' in columns:
                 traces.append({
-                    "x": filtered_data.index.strftime("%Y-%m-%d").tolist(),
-                    "y": filtered_data['MA75'].tolist(),
+                    "x": x_dates,
+                    "y": self.to_chart_values(filtered_data['MA75']),
                     "mode": "lines",
                     "name": "MA75",
                     "line": {"color": "#10b981", "width": 1, "dash": "dash"},
                     "type": "scatter"
                 })
             
-            if 'MA200' in filtered_data.columns:
+            if 'MA200' in columns:
                 traces.append({
-                    "x": filtered_data.index.strftime("%Y-%m-%d").tolist(),
-                    "y": filtered_data['MA200'].tolist(),
+                    "x": x_dates,
+                    "y": self.to_chart_values(filtered_data['MA200']),
                     "mode": "lines",
                     "name": "MA200",
                     "line": {"color": "#ef4444", "width": 1, "dash": "dash"},
@@ -194,9 +199,9 @@ class PriceChart(BaseChart):
             
             # layoutを生成
             layout = {
-                "title": self.title,
-                "xaxis": {"title": "日付"},
-                "yaxis": {"title": "株価"},
+                "title": {"text": self.title},
+                "xaxis": {"title": {"text": "日付"}},
+                "yaxis": {"title": {"text": "株価"}},
                 "hovermode": "x unified",
                 "height": 400,
                 "margin": {"l": 50, "r": 50, "t": 50, "b": 50},
@@ -204,8 +209,9 @@ class PriceChart(BaseChart):
             }
             
             # Y軸のマージンを確保
-            y_min = filtered_data['Close'].min()
-            y_max = filtered_data['Close'].max()
+            # float32の値は標準のjsonで数値にならないためfloatにする
+            y_min = float(filtered_data['Close'].min())
+            y_max = float(filtered_data['Close'].max())
             y_range = y_max - y_min
             layout["yaxis"]["range"] = [y_min - y_range * 0.1, y_max + y_range * 0.1]
             
@@ -5,7 +5,7 @@ import pandas as pd
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
-from .base_chart import BaseChart
+from .base_chart import BaseChart, content_cached
 
 
 class RateChart(BaseChart):
@@ -98,6 +98,7 @@ class RateChart(BaseChart):
         self.fig = fig
         return fig
     
+    @content_cached
     def create_multi_period_data(self, policy_data: pd.DataFrame, long_rate_data: pd.DataFrame, 
                                  periods: List[int]) -> Dict[int, Dict[str, Any]]:
         """
@@ -117,25 +118,27 @@ class RateChart(BaseChart):
         if (policy_data is None or policy_data.empty) and (long_rate_data is None or long_rate_data.empty):
             return result
         
+        # タイムゾーン情報の削除・期間の終端は全期間で共通なので、ループの前に1回だけ行う
+        if policy_data is not None and not policy_data.empty and policy_data.index.tz is not None:
+            policy_data = policy_data.copy()
+            policy_data.index = policy_data.index.tz_localize(None)
+        if long_rate_data is not None and not long_rate_data.empty and long_rate_data.index.tz is not None:
+            long_rate_data = long_rate_data.copy()
+            long_rate_data.index = long_rate_data.index.tz_localize(None)
+        end_date = datetime.now()
+        
         for years in periods:
             # 期間でフィルタリング
-            end_date = datetime.now()
             start_date = end_date - timedelta(days=years * 365)
             
             policy_filtered = pd.DataFrame()
             long_rate_filtered = pd.DataFrame()
             
             if policy_data is not None and not policy_data.empty:
-                policy_data_copy = policy_data.copy()
-                if policy_data_copy.index.tz is not None:
-                    policy_data_copy.index = policy_data_copy.index.tz_localize(None)
-                policy_filtered = policy_data_copy[(policy_data_copy.index >= start_date) & (policy_data_copy.index <= end_date)]
+                policy_filtered = policy_data[(policy_data.index >= start_date) & (policy_data.index <= end_date)]
             
             if long_rate_data is not None and not long_rate_data.empty:
-                long_rate_data_copy = long_rate_data.copy()
-                if long_rate_data_copy.index.tz is not None:
-                    long_rate_data_copy.index = long_rate_data_copy.index.tz_localize(None)
-                long_rate_filtered = long_rate_data_copy[(long_rate_data_copy.index >= start_date) & (long_rate_data_copy.index <= end_date)]
+                long_rate_filtered = long_rate_data[(long_rate_data.index >= start_date) & (long_rate_data.index <= end_date)]
             
             # 両方空の場合はスキップ
             if policy_filtered.empty and long_rate_filtered.empty:
@@ -148,7 +151,7 @@ class RateChart(BaseChart):
             if not policy_filtered.empty and 'policy_rate' in policy_filtered.columns:
                 traces.append({
                     "x": policy_filtered.index.strftime("%Y-%m-%d").tolist(),
-                    "y": policy_filtered['policy_rate'].tolist(),
+                    "y": self.to_chart_values(policy_filtered['policy_rate']),
                     "mode": "lines",
                     "name": "政策金利（名目）",
                     "line": {"color": "#2563eb", "width": 2},
@@ -159,7 +162,7 @@ class RateChart(BaseChart):
             if not long_rate_filtered.empty and 'long_rate_10y' in long_rate_filtered.columns:
                 traces.append({
                     "x": long_rate_filtered.index.strftime("%Y-%m-%d").tolist(),
-                    "y": long_rate_filtered['long_rate_10y'].tolist(),
+                    "y": self.to_chart_values(long_rate_filtered['long_rate_10y']),
                     "mode": "lines",
                     "name": "長期金利（10年）",
                     "line": {"color": "#f59e0b", "width": 2},
@@ -169,9 +172,9 @@ class RateChart(BaseChart):
             if traces:
                 # layoutを生成
                 layout = {
-                    "title": self.title,
-                    "xaxis": {"title": "日付"},
-                    "yaxis": {"title": "金利 (%)"},
+                    "title": {"text": self.title},
+                    "xaxis": {"title": {"text": "日付"}},
+                    "yaxis": {"title": {"text": "金利 (%)"}},
                     "hovermode": "x unified",
                     "height": 400,
                     "margin": {"l": 50, "r": 50, "t": 50, "b": 50},
@@ -49,7 +49,11 @@ class BaseFact(ABC):
         if column not in self.data.columns:
             return None
         
-        return float(self.data[column].iloc[-1])
+        value = self.data[column].iloc[-1]
+        if pd.isna(value):
+            return None
+        
+        return float(value)
     
     def get_date_range(self) -> Tuple[Optional[datetime], Optional[datetime]]:
         """
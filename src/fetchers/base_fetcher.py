@@ -3,10 +3,92 @@
 すべてのデータ取得クラスの基底クラス
 """
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Optional, Set
+import os
+import re
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 
+try:
+    import pyarrow  # noqa: F401  parquetの読み書きに使用
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+# 作成済みディレクトリ（同じディレクトリへの makedirs を繰り返さない）
+_CREATED_DIRS: Set[str] = set()
+
+
+def ensure_dir(dir_path: str):
+    """
+    ディレクトリを作成（プロセス内で作成済みなら何もしない）
+    
+    Args:
+        dir_path: ディレクトリパス
+    """
+    if dir_path in _CREATED_DIRS:
+        return
+    os.makedirs(dir_path, exist_ok=True)
+    _CREATED_DIRS.add(dir_path)
+
+
+def _existing_table_path(base_path: str) -> Optional[str]:
+    """
+    拡張子なしのパスに対応する既存ファイルを探す（parquet優先）
+    
+    Args:
+        base_path: 拡張子なしのファイルパス
+    
+    Returns:
+        Optional[str]: 読み込むファイルのパス（存在しない場合はNone）
+    """
+    if PARQUET_AVAILABLE and os.path.exists(f"{base_path}.parquet"):
+        return f"{base_path}.parquet"
+    if os.path.exists(f"{base_path}.csv"):
+        return f"{base_path}.csv"
+    return None
+
+
+def read_table(base_path: str) -> Optional[pd.DataFrame]:
+    """
+    保存済みの時系列データを読み込む（parquetがあれば優先、なければCSV）
+    
+    Args:
+        base_path: 拡張子なしのファイルパス
+    
+    Returns:
+        Optional[DataFrame]: 読み込んだデータ（ファイルが存在しない場合はNone）
+    """
+    filepath = _existing_table_path(base_path)
+    if filepath is None:
+        return None
+    if filepath.endswith(".parquet"):
+        return pd.read_parquet(filepath)
+    return pd.read_csv(filepath, index_col=0, parse_dates=True, encoding='utf-8-sig')
+
+
+def write_table(df: pd.DataFrame, base_path: str) -> str:
+    """
+    時系列データを保存（pyarrowがあればparquet(snappy)、なければCSV）
+    
+    Args:
+        df: 保存するDataFrame
+        base_path: 拡張子なしのファイルパス
+    
+    Returns:
+        str: 保存したファイルのパス
+    """
+    ensure_dir(os.path.dirname(base_path))
+    if PARQUET_AVAILABLE:
+        filepath = f"{base_path}.parquet"
+        df.to_parquet(filepath, engine='pyarrow', compression='snappy', index=True)
+    else:
+        filepath = f"{base_path}.csv"
+        df.to_csv(filepath, encoding='utf-8-sig')
+    return filepath
+
 
 class BaseFetcher(ABC):
     """データ取得の基底クラス"""
@@ -50,17 +132,108 @@ class BaseFetcher(ABC):
     
     def save_raw_data(self, df: pd.DataFrame, filename: str):
         """
-        生データをCSVとして保存
+        生データを保存（pyarrowがあればparquet、なければCSV）
         
         Args:
             df: 保存するDataFrame
             filename: ファイル名（拡張子なし）
         """
-        import os
         output_dir = f"data/raw/{self.market_code.lower()}"
-        os.makedirs(output_dir, exist_ok=True)
-        filepath = os.path.join(output_dir, f"{filename}.csv")
-        df.to_csv(filepath, encoding='utf-8-sig')
+        write_table(df, os.path.join(output_dir, filename))
+    
+    @staticmethod
+    def build_float32_frame(columns: Dict[str, object], index: pd.Index) -> pd.DataFrame:
+        """
+        複数の数値列をひとつのfloat32配列にまとめてDataFrameを作る
+        
+        列ごとに配列を確保・コピーせず、(列数, 行数) の配列を1回だけ確保して埋める。
+        各列は連続したメモリになり、DataFrame内部でもひとつのブロックになる。
+        
+        Args:
+            columns: 列名 -> 値（配列・Series・スカラー）
+            index: index
+        
+        Returns:
+            DataFrame: float32のDataFrame
+        """
+        values = np.empty((len(columns), len(index)), dtype=np.float32)
+        for row, column in zip(values, columns.values()):
+            row[:] = column.to_numpy(dtype=np.float32) if isinstance(column, pd.Series) else column
+        return pd.DataFrame(values.T, index=index, columns=list(columns), copy=False)
+    
+    @staticmethod
+    def ensure_datetime_index(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        indexを日付型にそろえ、index名を'Date'に統一する
+        
+        既に日付型の場合は変換しない（dtypeで判定し、再パースやコピーを避ける）。
+        
+        Args:
+            df: 対象のDataFrame（indexを直接書き換える）
+        
+        Returns:
+            DataFrame: 引数と同じDataFrame
+        """
+        if df.index.dtype.kind != 'M':
+            df.index = pd.DatetimeIndex(df.index, copy=False)
+        df.index.name = 'Date'
+        return df
+    
+    @staticmethod
+    def _cache_path(category: str, key: str) -> str:
+        """
+        差分取得用キャッシュのファイルパスを取得
+        
+        Args:
+            category: キャッシュ種別（例: "price"）
+            key: キャッシュキー（例: シンボル）
+        
+        Returns:
+            str: キャッシュファイルのパス（拡張子なし）
+        """
+        # "^GSPC" などファイル名に使いにくい文字を置換
+        safe_key = re.sub(r'[^0-9A-Za-z_.-]', '_', key)
+        return os.path.join("data", "cache", category, safe_key)
+    
+    @staticmethod
+    def load_cache(category: str, key: str, min_mtime: Optional[datetime] = None) -> Optional[pd.DataFrame]:
+        """
+        差分取得用キャッシュを読み込む
+        
+        Args:
+            category: キャッシュ種別
+            key: キャッシュキー
+            min_mtime: 指定した場合、これより前に更新されたキャッシュは使わない
+        
+        Returns:
+            Optional[DataFrame]: キャッシュデータ（存在しない・読めない・古い場合はNone）
+        """
+        base_path = BaseFetcher._cache_path(category, key)
+        filepath = _existing_table_path(base_path)
+        if filepath is None:
+            return None
+        if min_mtime is not None and datetime.fromtimestamp(os.path.getmtime(filepath)) < min_mtime:
+            return None
+        try:
+            df = read_table(base_path)
+        except Exception as e:
+            print(f"キャッシュ読み込みエラー ({filepath}): {e}")
+            return None
+        if df is None or df.empty or not isinstance(df.index, pd.DatetimeIndex):
+            return None
+        return df
+    
+    @staticmethod
+    def save_cache(df: pd.DataFrame, category: str, key: str):
+        """
+        差分取得用キャッシュを保存
+        
+        Args:
+            df: 保存するDataFrame
+            category: キャッシュ種別
+            key: キャッシュキー
+        """
+        write_table(df, BaseFetcher._cache_path(category, key))
     
     def get_years_ago_date(self, years: int) -> datetime:
         """
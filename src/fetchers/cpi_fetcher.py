@@ -4,13 +4,16 @@ CPI（消費者物価指数）データ取得
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Optional
-from fredapi import Fred
 import os
 import requests
-from dotenv import load_dotenv
 from .base_fetcher import BaseFetcher
+from .fred_client import get_fred_client
 
-load_dotenv()
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 class CPIFetcher(BaseFetcher):
@@ -24,11 +27,8 @@ class CPIFetcher(BaseFetcher):
         super().__init__(market_code)
         
         if market_code == "US":
-            # FRED APIキーの取得（環境変数から取得）
-            api_key = os.getenv("FRED_API_KEY")
-            if not api_key:
-                raise RuntimeError("FRED_API_KEYが設定されていません（GitHub Secretsを確認してください）")
-            self.fred = Fred(api_key=api_key)
+            # FREDクライアント（プロセス内で共有）
+            self.fred = get_fred_client()
             self.series_id = "CPIAUCSL"  # Consumer Price Index for All Urban Consumers: All Items
         elif market_code == "JP":
             # e-Stat APIキーの取得（環境変数から取得）
@@ -72,8 +72,7 @@ class CPIFetcher(BaseFetcher):
             df['CPI_YoY'] = df['CPI'].pct_change(periods=12, fill_method=None) * 100  # 12ヶ月前との比較
             
             # 日付をindexに設定
-            if not isinstance(df.index, pd.DatetimeIndex):
-                df.index = pd.to_datetime(df.index)
+            self.ensure_datetime_index(df)
             
             return df
             
@@ -124,7 +123,8 @@ class CPIFetcher(BaseFetcher):
             response = requests.get(url, params=params, timeout=30)
             response.raise_for_status()
             
-            data_json = response.json()
+            # レスポンスのJSONパース（orjsonがあればCパーサーを使う）
+            data_json = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             
             # フルパスでアクセス（必須修正点①）
             get_stats_data = data_json.get("GET_STATS_DATA", {})
@@ -160,6 +160,9 @@ class CPIFetcher(BaseFetcher):
             
             # VALUEが配列の場合
             if isinstance(value_list, list):
+                # パースエラーは行ごとに出力せず、件数と最初の1件だけまとめて出力する
+                parse_error_count = 0
+                first_parse_error = None
                 for value_info in value_list:
                     # 必須修正点③：VALUEパース処理の強化
                     # time取得順序: @time → time
@@ -181,9 +184,15 @@ class CPIFetcher(BaseFetcher):
                                 value = float(value_str)
                                 data_points.append({"date": date, "CPI": value})
                         except (ValueError, TypeError) as e:
-                            # デバッグログを残す
-                            print(f"デバッグ: VALUEパースエラー - date_str: {date_str}, value_str: {value_str}, エラー: {e}")
+                            parse_error_count += 1
+                            if first_parse_error is None:
+                                first_parse_error = (date_str, value_str, e)
                             continue
+                
+                if parse_error_count:
+                    # デバッグログを残す
+                    date_str, value_str, e = first_parse_error
+                    print(f"デバッグ: VALUEパースエラー {parse_error_count}件（最初の1件: date_str: {date_str}, value_str: {value_str}, エラー: {e}）")
             
             # VALUEが単一オブジェクトの場合
             elif isinstance(value_list, dict):
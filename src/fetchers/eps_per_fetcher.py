@@ -1,14 +1,22 @@
 """
 EPS + PERデータ取得
 """
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import Optional
+from functools import lru_cache
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 from .base_fetcher import BaseFetcher
 
+# multpl.comのページのうち、必要な要素（データ配列を含むscriptと表）のみをパースする
+_MULTPL_STRAINER = SoupStrainer(['script', 'table'])
+
+# JavaScript内のデータ配列（例: ["date", value]）
+_MULTPL_DATA_PATTERN = re.compile(r'\["([^"]+)",\s*([\d.]+)\]')
+
 
 def fetch_sp500_per() -> pd.DataFrame:
     """
@@ -26,7 +34,7 @@ def fetch_sp500_per() -> pd.DataFrame:
         response = requests.get(url, timeout=30, headers=headers)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, 'html.parser', parse_only=_MULTPL_STRAINER)
         
         # JavaScript内のデータを探す
         scripts = soup.find_all('script')
@@ -36,7 +44,7 @@ def fetch_sp500_per() -> pd.DataFrame:
             if script.string:
                 # データ配列を探す（例: [[date, value], ...]）
                 # multpl.comは通常、JavaScript内にデータ配列を含む
-                matches = re.findall(r'\["([^"]+)",\s*([\d.]+)\]', script.string)
+                matches = _MULTPL_DATA_PATTERN.findall(script.string)
                 if matches:
                     for date_str, per_str in matches:
                         try:
@@ -130,28 +138,27 @@ def fetch_nikkei_eps_per() -> pd.DataFrame:
             print("日経平均CSVに日付カラムが見つかりませんでした")
             return pd.DataFrame()
         
-        # データフレームを構築
-        result_data = []
-        for _, row in df.iterrows():
-            try:
-                date = pd.to_datetime(row[date_col])
-                eps = float(row[eps_col]) if eps_col and pd.notna(row[eps_col]) else None
-                per = float(row[per_col]) if per_col and pd.notna(row[per_col]) else None
-                
-                result_data.append({
-                    'date': date,
-                    'nikkei_eps': eps,
-                    'nikkei_per': per
-                })
-            except (ValueError, KeyError):
+        # データフレームを構築（行ごとのループを使わず列単位で変換）
+        dates = pd.to_datetime(df[date_col], errors='coerce')
+        columns = {}
+        # 日付が解釈できない行は除外
+        valid = dates.notna()
+        for name, col in (('nikkei_eps', eps_col), ('nikkei_per', per_col)):
+            if not col:
+                columns[name] = np.nan
                 continue
+            values = pd.to_numeric(df[col], errors='coerce')
+            # 値があるのに数値として解釈できない行（"1,234" など）も除外（欠損はNaNのまま残す）
+            valid &= df[col].isna() | values.notna()
+            columns[name] = values
+        df_result = pd.DataFrame(columns, index=df.index)
+        df_result.index = pd.DatetimeIndex(dates, name='date')
+        df_result = df_result[valid.to_numpy()]
         
-        if not result_data:
+        if df_result.empty:
             print("日経平均CSVから有効なデータを取得できませんでした")
             return pd.DataFrame()
         
-        df_result = pd.DataFrame(result_data)
-        df_result.set_index('date', inplace=True)
         df_result.sort_index(inplace=True)
         
         return df_result
@@ -161,6 +168,64 @@ def fetch_nikkei_eps_per() -> pd.DataFrame:
         return pd.DataFrame()
 
 
+# キャッシュ名 -> 取得関数
+_SOURCES = {
+    "sp500_per": fetch_sp500_per,
+    "nikkei_eps_per": fetch_nikkei_eps_per,
+}
+
+
+class _EmptySourceError(Exception):
+    """取得元データが空（失敗結果をlru_cacheに残さないために使う）"""
+
+
+@lru_cache(maxsize=8)
+def _fetch_source_cached(name: str, day: str) -> pd.DataFrame:
+    """
+    EPS/PERの取得元データを1日単位でキャッシュして取得
+
+    同一プロセス内はlru_cache、プロセスをまたぐ場合は当日更新の
+    ディスクキャッシュ（data/cache/eps_per）を使う。
+    返すDataFrameは共有されるため、呼び出し側で変更しないこと。
+
+    Args:
+        name: 取得元の名前（"sp500_per" or "nikkei_eps_per"）
+        day: 日付文字列（YYYY-MM-DD、キャッシュキー）
+
+    Returns:
+        DataFrame: 取得元データ
+
+    Raises:
+        _EmptySourceError: 取得に失敗した場合（例外はキャッシュされないため次回は取得し直す）
+    """
+    cached = BaseFetcher.load_cache("eps_per", name, min_mtime=datetime.strptime(day, "%Y-%m-%d"))
+    if cached is not None:
+        return cached
+
+    df = _SOURCES[name]()
+    if df.empty:
+        raise _EmptySourceError(name)
+    BaseFetcher.save_cache(df, "eps_per", name)
+    return df
+
+
+def _fetch_source(name: str, day: str) -> pd.DataFrame:
+    """
+    EPS/PERの取得元データを取得（取得できたデータだけをキャッシュする）
+
+    Args:
+        name: 取得元の名前（"sp500_per" or "nikkei_eps_per"）
+        day: 日付文字列（YYYY-MM-DD、キャッシュキー）
+
+    Returns:
+        DataFrame: 取得元データ（取得失敗時は空のDataFrame）
+    """
+    try:
+        return _fetch_source_cached(name, day)
+    except _EmptySourceError:
+        return pd.DataFrame()
+
+
 class EPSPERFetcher(BaseFetcher):
     """EPS + PERデータを取得するクラス"""
     
@@ -189,7 +254,7 @@ class EPSPERFetcher(BaseFetcher):
         try:
             if self.market_code == "US":
                 # S&P500 PERデータを取得
-                df = fetch_sp500_per()
+                df = _fetch_source("sp500_per", datetime.now().strftime("%Y-%m-%d"))
                 if df.empty:
                     return pd.DataFrame()
                 
@@ -202,9 +267,11 @@ class EPSPERFetcher(BaseFetcher):
                 # 既存のチャートクラスが期待する形式に変換
                 # EPSカラムは空（USはPERのみ）
                 # PERカラムにsp500_perをマッピング
-                df_result = pd.DataFrame(index=df.index)
-                df_result['EPS'] = None  # USはEPSデータなし
-                df_result['PER'] = df['sp500_per']
+                # USはEPSデータなし（object列を作らずfloat32のNaN列にする）
+                df_result = self.build_float32_frame({
+                    'EPS': np.nan,
+                    'PER': df['sp500_per']
+                }, df.index)
                 
                 # 生データを保存（元の形式で）
                 self.save_raw_data(df, "eps_per")
@@ -213,7 +280,7 @@ class EPSPERFetcher(BaseFetcher):
                 
             elif self.market_code == "JP":
                 # 日経平均EPS/PERデータを取得
-                df = fetch_nikkei_eps_per()
+                df = _fetch_source("nikkei_eps_per", datetime.now().strftime("%Y-%m-%d"))
                 if df.empty:
                     return pd.DataFrame()
                 
@@ -225,9 +292,10 @@ class EPSPERFetcher(BaseFetcher):
                 
                 # 既存のチャートクラスが期待する形式に変換
                 # EPSとPERカラムにマッピング
-                df_result = pd.DataFrame(index=df.index)
-                df_result['EPS'] = df['nikkei_eps']
-                df_result['PER'] = df['nikkei_per']
+                df_result = self.build_float32_frame({
+                    'EPS': df['nikkei_eps'],
+                    'PER': df['nikkei_per']
+                }, df.index)
                 
                 # 生データを保存（元の形式で）
                 self.save_raw_data(df, "eps_per")
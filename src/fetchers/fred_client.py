@@ -0,0 +1,54 @@
+"""
+FREDクライアントの共有
+RateFetcher・CPIFetcherで同じFredインスタンスを使い回す
+"""
+import os
+from typing import Dict, Optional
+from fredapi import Fred
+from dotenv import load_dotenv
+
+# .envの読み込みはモジュール読み込み時の1回のみ
+load_dotenv()
+
+# FRED APIキー（初回参照時に環境変数から読み込む）
+_API_KEY: Optional[str] = None
+
+# APIキーごとのFredインスタンス
+_FRED_CLIENTS: Dict[str, Fred] = {}
+
+
+def _get_api_key() -> str:
+    """
+    FRED APIキーを取得（環境変数の参照はプロセス内で1回のみ）
+
+    Returns:
+        str: FRED APIキー
+
+    Raises:
+        RuntimeError: FRED_API_KEYが設定されていない場合
+    """
+    global _API_KEY
+    if _API_KEY is None:
+        # FRED APIキーの取得（環境変数から取得）
+        api_key = os.getenv("FRED_API_KEY")
+        if not api_key:
+            raise RuntimeError("FRED_API_KEYが設定されていません（GitHub Secretsを確認してください）")
+        _API_KEY = api_key
+    return _API_KEY
+
+
+def get_fred_client() -> Fred:
+    """
+    FREDクライアントを取得（APIキーごとに1つだけ生成）
+
+    Returns:
+        Fred: FREDクライアント
+
+    Raises:
+        RuntimeError: FRED_API_KEYが設定されていない場合
+    """
+    api_key = _get_api_key()
+    client = _FRED_CLIENTS.get(api_key)
+    if client is None:
+        client = _FRED_CLIENTS.setdefault(api_key, Fred(api_key=api_key))
+    return client
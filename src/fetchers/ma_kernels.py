@@ -0,0 +1,52 @@
+"""
+移動平均の計算カーネル
+MA20/MA75/MA200をNumPyの累積和で計算する
+"""
+from typing import List
+import numpy as np
+
+
+def rolling_mean_np(x: np.ndarray, w: int) -> np.ndarray:
+    """
+    累積和の差分で移動平均を計算（min_periods=1相当）
+
+    Args:
+        x: 値の配列（float64）
+        w: ウィンドウ幅
+
+    Returns:
+        ndarray: 移動平均（xと同じ長さ）
+    """
+    c = np.concatenate(([0.0], np.cumsum(x)))
+    s = c[w:] - c[:-w]
+    # ウィンドウが埋まるまでの先頭部分は、同じ累積和をそれまでの要素数で割る（min_periods=1相当）
+    n_head = min(x.size, w - 1)
+    head = c[1:n_head + 1] / np.arange(1, n_head + 1)
+    return np.concatenate([head, s / w])
+
+
+def rolling_means(close: np.ndarray) -> dict:
+    """
+    MA20/MA75/MA200を計算
+
+    Args:
+        close: 終値の配列
+
+    Returns:
+        dict: {'MA20': ndarray, 'MA75': ndarray, 'MA200': ndarray}
+    """
+    x = np.ascontiguousarray(close, dtype=np.float64)
+    return {f'MA{w}': rolling_mean_np(x, w) for w in (20, 75, 200)}
+
+
+def rolling_means_many(closes: List[np.ndarray]) -> List[dict]:
+    """
+    複数シンボルのMA20/MA75/MA200をまとめて計算
+
+    Args:
+        closes: シンボルごとの終値の配列（長さは不揃いでよい）
+
+    Returns:
+        List[dict]: closesと同じ順の {'MA20': ndarray, 'MA75': ndarray, 'MA200': ndarray}
+    """
+    return [rolling_means(close) for close in closes]
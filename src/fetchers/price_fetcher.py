@@ -2,11 +2,99 @@
 株価指数データ取得
 """
 import yfinance as yf
+import numpy as np
 import pandas as pd
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import random
 import time
 from .base_fetcher import BaseFetcher
+from .ma_kernels import rolling_means, rolling_means_many
+
+
+# 移動平均のウィンドウ（MA20, MA75, MA200）
+MA_WINDOWS = (20, 75, 200)
+
+# 保存時の列の型（価格は有効桁6桁程度のためfloat32で十分）
+PRICE_DTYPES = {'Close': 'float32', 'MA20': 'float32', 'MA75': 'float32', 'MA200': 'float32'}
+
+# キャッシュの末尾がこの日数より古い場合は差分取得せず全期間を取り直す
+CACHE_MAX_AGE_DAYS = 30
+
+# キャッシュの先頭が開始日よりこの日数以内なら開始日をカバーしているとみなす（休場日対策）
+CACHE_START_TOLERANCE_DAYS = 7
+
+# リトライ設定（指数バックオフ + ジッター）
+MAX_RETRIES = 3
+MAX_RETRY_DELAY = 30
+
+# リトライ対象のHTTPステータス（レート制限・サーバーエラー）
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# リトライ対象の例外クラス名（requests / curl_cffi / yfinance で共通の名前）
+RETRYABLE_ERROR_NAMES = {'Timeout', 'ConnectTimeout', 'ReadTimeout', 'ConnectionError', 'YFRateLimitError'}
+
+# シンボルごとのTickerオブジェクト（cookie/crumbの取得をプロセス内で使い回す）
+_TICKERS: Dict[str, yf.Ticker] = {}
+
+
+def _ticker(symbol: str) -> yf.Ticker:
+    """
+    シンボルに対応するTickerを取得（プロセス内で1つだけ生成）
+    
+    Args:
+        symbol: yfinanceのシンボル
+    
+    Returns:
+        yf.Ticker: Tickerオブジェクト
+    """
+    ticker = _TICKERS.get(symbol)
+    if ticker is None:
+        ticker = _TICKERS.setdefault(symbol, yf.Ticker(symbol))
+    return ticker
+
+
+def clear_ticker_cache():
+    """Tickerオブジェクトのキャッシュを破棄"""
+    _TICKERS.clear()
+
+
+def _is_retryable(error: Exception) -> bool:
+    """
+    リトライすべき一時的なエラーか判定
+    
+    Args:
+        error: 発生した例外
+    
+    Returns:
+        bool: タイムアウト・接続エラー・レート制限・5xxの場合True
+    """
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    if any(cls.__name__ in RETRYABLE_ERROR_NAMES for cls in type(error).__mro__):
+        return True
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None) in RETRYABLE_STATUS
+
+
+def _call_with_retry(func: Callable[[], Any]) -> Any:
+    """
+    一時的なエラーの場合のみ指数バックオフ + ジッターでリトライして呼び出す
+    
+    Args:
+        func: 呼び出す関数
+    
+    Returns:
+        Any: funcの戻り値
+    """
+    for attempt in range(MAX_RETRIES):
+        try:
+            return func()
+        except Exception as e:
+            # 認証エラーなど一時的でないエラーや最終試行はそのまま送出
+            if attempt >= MAX_RETRIES - 1 or not _is_retryable(e):
+                raise
+            time.sleep(min(MAX_RETRY_DELAY, 2 ** attempt) + random.uniform(0, 1))
 
 
 class PriceFetcher(BaseFetcher):
@@ -25,6 +113,9 @@ class PriceFetcher(BaseFetcher):
         """
         株価データを取得
         
+        キャッシュ（data/cache/price）が開始日をカバーしていて末尾が新しい場合は、
+        末尾より後の日足のみを取得して結合する（差分取得）。
+        
         Args:
             start_date: 開始日
             end_date: 終了日
@@ -32,56 +123,333 @@ class PriceFetcher(BaseFetcher):
         Returns:
             DataFrame: 日次株価データ
                 - index: 日付
-                - columns: ['Close', 'MA20', 'MA75', 'MA200']（移動平均は後で計算）
+                - columns: ['Close', 'MA20', 'MA75', 'MA200']
         """
+        df = self._fetch_frame(start_date, end_date)
+        if df.empty:
+            return pd.DataFrame()
+        
         try:
-            ticker = yf.Ticker(self.symbol)
-            
-            # 開始日が指定されていない場合は10年前から
-            if start_date is None:
-                start_date = datetime.now().replace(year=datetime.now().year - 10)
-            
-            # 終了日が指定されていない場合は今日まで
-            if end_date is None:
-                end_date = datetime.now()
-            
-            # データ取得（リトライロジック付き）
-            max_retries = 3
-            retry_delay = 2
-            
-            for attempt in range(max_retries):
-                try:
-                    hist = ticker.history(start=start_date, end=end_date)
-                    break
-                except Exception as e:
-                    if attempt < max_retries - 1:
-                        time.sleep(retry_delay)
-                    else:
-                        raise e
-            
-            if hist.empty:
-                return pd.DataFrame()
-            
-            # Close価格のみを抽出
-            df = pd.DataFrame({
-                'Close': hist['Close']
-            })
-            
-            # 移動平均を計算（MA20, MA75, MA200）
-            df['MA20'] = df['Close'].rolling(window=20, min_periods=1).mean()
-            df['MA75'] = df['Close'].rolling(window=75, min_periods=1).mean()
-            df['MA200'] = df['Close'].rolling(window=200, min_periods=1).mean()
-            
-            # 日付をindexに設定（既にindexになっているはずだが念のため）
-            if not isinstance(df.index, pd.DatetimeIndex):
-                df.index = pd.to_datetime(df.index)
-            
             # 生データを保存
             self.save_raw_data(df, "price")
+        except Exception as e:
+            print(f"株価データ保存エラー ({self.symbol}): {e}")
+        
+        return df
+    
+    def fetch_arrays(self, start_date: Optional[datetime] = None,
+                     end_date: Optional[datetime] = None) -> Tuple[pd.DatetimeIndex, Dict[str, np.ndarray]]:
+        """
+        株価データを列ごとの配列で取得
+        
+        Args:
+            start_date: 開始日
+            end_date: 終了日
+        
+        Returns:
+            Tuple[DatetimeIndex, Dict[str, ndarray]]: 日付と、列名 -> float32配列
+                （'Close', 'MA20', 'MA75', 'MA200'）。取得失敗時は空のindexと空のdict
+        """
+        df = self._fetch_frame(start_date, end_date)
+        if df.empty:
+            return pd.DatetimeIndex([], name='Date'), {}
+        
+        # 全列がひとつのfloat32配列に収まっているため、列の取り出しはコピーにならない
+        return df.index, {column: df[column].to_numpy() for column in PRICE_DTYPES}
+    
+    def _fetch_frame(self, start_date: Optional[datetime], end_date: Optional[datetime]) -> pd.DataFrame:
+        """
+        キャッシュと差分取得を組み合わせて要求期間のデータを作る
+        
+        Args:
+            start_date: 開始日
+            end_date: 終了日
+        
+        Returns:
+            DataFrame: Close と移動平均（取得失敗時は空のDataFrame）
+        """
+        try:
+            start_date, end_date = self._resolve_range(start_date, end_date)
+            
+            cached = self.load_cache("price", self.symbol)
+            if not self._can_use_cache(cached, start_date):
+                cached = None
             
-            return df
+            new = pd.DataFrame()
+            download_start = self._download_start(cached, start_date, end_date)
+            if download_start is not None:
+                new = self._download_close(download_start, end_date)
             
+            return self._merge_and_cache(self.symbol, cached, new, start_date, end_date)
+        
         except Exception as e:
             print(f"株価データ取得エラー ({self.symbol}): {e}")
             return pd.DataFrame()
+    
+    @classmethod
+    def fetch_many(cls, symbols: List[str], start_date: Optional[datetime] = None,
+                   end_date: Optional[datetime] = None) -> Dict[str, pd.DataFrame]:
+        """
+        複数シンボルの株価データを1回のリクエストでまとめて取得
+        
+        全期間取得が必要なシンボルと差分取得で足りるシンボルに分け、
+        それぞれyf.downloadを1回ずつ呼ぶ。生データの保存は呼び出し側で行う。
+        
+        Args:
+            symbols: yfinanceのシンボルのリスト
+            start_date: 開始日
+            end_date: 終了日
+        
+        Returns:
+            Dict[str, DataFrame]: シンボルごとの日次株価データ（取得失敗時は空のDataFrame）
+        """
+        start_date, end_date = cls._resolve_range(start_date, end_date)
+        
+        caches = {}
+        groups = {}  # 全期間取得かどうか -> [(シンボル, 取得開始日)]
+        for symbol in symbols:
+            cached = cls.load_cache("price", symbol)
+            if not cls._can_use_cache(cached, start_date):
+                cached = None
+            caches[symbol] = cached
+            download_start = cls._download_start(cached, start_date, end_date)
+            if download_start is not None:
+                groups.setdefault(cached is None, []).append((symbol, download_start))
+        
+        downloaded = {}
+        for group in groups.values():
+            group_symbols = [symbol for symbol, _ in group]
+            group_start = min(download_start for _, download_start in group)
+            try:
+                downloaded.update(cls._download_close_many(group_symbols, group_start, end_date))
+            except Exception as e:
+                print(f"株価データ一括取得エラー ({', '.join(group_symbols)}): {e}")
+        
+        # キャッシュがないシンボルの移動平均はまとめて計算
+        full_symbols = [symbol for symbol in symbols if caches[symbol] is None and symbol in downloaded]
+        full_means = rolling_means_many([downloaded[symbol]['Close'].to_numpy() for symbol in full_symbols])
+        for symbol, means in zip(full_symbols, full_means):
+            for name, values in means.items():
+                downloaded[symbol][name] = values
+        
+        results = {}
+        for symbol in symbols:
+            try:
+                results[symbol] = cls._merge_and_cache(
+                    symbol, caches[symbol], downloaded.get(symbol, pd.DataFrame()), start_date, end_date
+                )
+            except Exception as e:
+                print(f"株価データ取得エラー ({symbol}): {e}")
+                results[symbol] = pd.DataFrame()
+        return results
+    
+    @staticmethod
+    def _resolve_range(start_date: Optional[datetime], end_date: Optional[datetime]) -> Tuple[datetime, datetime]:
+        """
+        取得期間の既定値を補う
+        
+        Args:
+            start_date: 開始日
+            end_date: 終了日
+        
+        Returns:
+            Tuple[datetime, datetime]: (開始日, 終了日)
+        """
+        # 開始日が指定されていない場合は10年前から
+        if start_date is None:
+            start_date = datetime.now().replace(year=datetime.now().year - 10)
+        
+        # 終了日が指定されていない場合は今日まで
+        if end_date is None:
+            end_date = datetime.now()
+        
+        return start_date, end_date
+    
+    @staticmethod
+    def _can_use_cache(cached: Optional[pd.DataFrame], start_date: datetime) -> bool:
+        """
+        キャッシュを差分取得の起点に使えるか判定
+        
+        Args:
+            cached: キャッシュデータ
+            start_date: 開始日
+        
+        Returns:
+            bool: 使える場合True
+        """
+        if cached is None or cached.empty or 'Close' not in cached.columns:
+            return False
+        if cached.index.min() > pd.Timestamp(start_date) + timedelta(days=CACHE_START_TOLERANCE_DAYS):
+            return False
+        return datetime.now() - cached.index.max() <= timedelta(days=CACHE_MAX_AGE_DAYS)
+    
+    @staticmethod
+    def _download_start(cached: Optional[pd.DataFrame], start_date: datetime, end_date: datetime) -> Optional[datetime]:
+        """
+        ダウンロードの開始日を決める
+        
+        キャッシュがない場合は、キャッシュを育てるため開始日が10年以内でも10年分を取得する。
+        キャッシュの最終日は取り直す（取引時間中に取得した暫定の終値を確定値で上書きする）。
+        
+        Args:
+            cached: 使用可能なキャッシュ（ない場合はNone）
+            start_date: 開始日
+            end_date: 終了日
+        
+        Returns:
+            Optional[datetime]: ダウンロード開始日（ダウンロード不要の場合はNone）
+        """
+        if cached is None:
+            ten_years_ago = datetime.now().replace(year=datetime.now().year - 10)
+            return min(start_date, ten_years_ago)
+        
+        # 最終日を含めて取得し、_spliceで重複行を新しい値に置き換える
+        delta_start = cached.index.max()
+        if delta_start > pd.Timestamp(end_date):
+            return None
+        return delta_start.to_pydatetime()
+    
+    @classmethod
+    def _merge_and_cache(cls, symbol: str, cached: Optional[pd.DataFrame], new: pd.DataFrame,
+                         start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """
+        キャッシュと新規取得分を結合してキャッシュを更新し、要求期間で切り出す
+        
+        Args:
+            symbol: yfinanceのシンボル
+            cached: 使用可能なキャッシュ（ない場合はNone）
+            new: 新規取得したClose列のみのデータ
+            start_date: 開始日
+            end_date: 終了日
+        
+        Returns:
+            DataFrame: Close と移動平均（要求期間のみ）
+        """
+        if cached is None:
+            if new.empty:
+                return pd.DataFrame()
+            df = new
+            # 移動平均を1回の走査で計算（MA20, MA75, MA200）。fetch_manyでは計算済み
+            if 'MA20' not in df.columns:
+                for name, values in rolling_means(df['Close'].to_numpy()).items():
+                    df[name] = values
+        elif new.empty:
+            df = cached
+        else:
+            df = cls._splice(cached, new)
+        
+        # 移動平均はfloat64で計算済みのため、格納時のみfloat32に落とす（ひとつの配列にまとめる）
+        df = cls.build_float32_frame({column: df[column] for column in PRICE_DTYPES}, df.index)
+        if not new.empty:
+            cls.save_cache(df, "price", symbol)
+        
+        # 要求期間で切り出す（日付は昇順のため位置で切り出し、ブロックをコピーしない）
+        begin = df.index.searchsorted(pd.Timestamp(start_date), side='left')
+        stop = df.index.searchsorted(pd.Timestamp(end_date), side='right')
+        return df.iloc[begin:stop]
+    
+    @staticmethod
+    def _splice(cached: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+        """
+        キャッシュに新しい日足を結合
+        
+        移動平均は新しい行（と計算に必要な直前の行）だけを再計算して差し込む。
+        
+        Args:
+            cached: キャッシュデータ
+            new: 新規取得したClose列のみのデータ
+        
+        Returns:
+            DataFrame: 結合後のデータ
+        """
+        # キャッシュはfloat32で保存されているため、再計算前にfloat64へ戻す
+        full = pd.concat([cached.astype('float64'), new])
+        full = full.loc[~full.index.duplicated(keep='last')].sort_index()
+        
+        # 新しい行の先頭位置から、最大ウィンドウ分さかのぼった範囲だけ再計算
+        first_new = full.index.get_loc(new.index[0])
+        tail_start = max(0, first_new - max(MA_WINDOWS) + 1)
+        tail_means = rolling_means(full['Close'].to_numpy()[tail_start:])
+        for name, values in tail_means.items():
+            full.iloc[first_new:, full.columns.get_loc(name)] = values[first_new - tail_start:]
+        return full
+    
+    def _download_close(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """
+        yfinanceから終値を取得（リトライロジック付き）
+        
+        Args:
+            start_date: 開始日
+            end_date: 終了日
+        
+        Returns:
+            DataFrame: Close列のみ（indexはタイムゾーンなしの日付）
+        """
+        ticker = _ticker(self.symbol)
+        hist = _call_with_retry(lambda: ticker.history(start=start_date, end=end_date))
+        
+        if hist.empty:
+            return pd.DataFrame()
+        
+        return _close_frame(hist['Close'])
+    
+    @staticmethod
+    def _download_close_many(symbols: List[str], start_date: datetime, end_date: datetime) -> Dict[str, pd.DataFrame]:
+        """
+        yfinanceから複数シンボルの終値をまとめて取得（リトライロジック付き）
+        
+        Args:
+            symbols: yfinanceのシンボルのリスト
+            start_date: 開始日
+            end_date: 終了日
+        
+        Returns:
+            Dict[str, DataFrame]: シンボルごとのClose列のみのデータ（取得できたもののみ）
+        """
+        # auto_adjustはTicker.historyの既定値に揃える
+        raw = _call_with_retry(lambda: yf.download(
+            tickers=" ".join(symbols), start=start_date, end=end_date,
+            group_by='ticker', threads=True, progress=False, auto_adjust=True
+        ))
+        
+        if raw is None or raw.empty:
+            return {}
+        
+        results = {}
+        for symbol in symbols:
+            if isinstance(raw.columns, pd.MultiIndex):
+                if symbol not in raw.columns.get_level_values(0):
+                    continue
+                close = raw[symbol]['Close']
+            else:
+                close = raw['Close']
+            df = _close_frame(close)
+            if not df.empty:
+                results[symbol] = df
+        return results
 
+
+def _close_frame(close: pd.Series) -> pd.DataFrame:
+    """
+    終値のSeriesをキャッシュと結合できる形に整える
+    
+    Args:
+        close: 終値のSeries
+    
+    Returns:
+        DataFrame: Close列のみ（indexはタイムゾーンなしの日付）
+    """
+    # 欠損した終値は移動平均の累積和を壊すため除外
+    df = pd.DataFrame({
+        'Close': close
+    }).dropna()
+    
+    # 日付をindexに設定（既にindexになっているはずだが念のため）
+    BaseFetcher.ensure_datetime_index(df)
+    
+    # キャッシュと結合できるようタイムゾーンを外す
+    if df.index.tz is not None:
+        df.index = df.index.tz_localize(None)
+        df.index.name = 'Date'
+    
+    return df
@@ -3,13 +3,25 @@
 """
 import pandas as pd
 from datetime import datetime
-from typing import Optional
-from fredapi import Fred
-import os
-from dotenv import load_dotenv
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from .base_fetcher import BaseFetcher
+from .fred_client import get_fred_client
 
-load_dotenv()
+# 並列取得時の最大スレッド数（I/O待ちが中心のためCPU数より多くてよい）
+MAX_WORKERS = 8
+
+# 市場コード・金利種別ごとのFREDシリーズID
+SERIES_IDS = {
+    "US": {
+        "policy": "DFF",  # Federal Funds Effective Rate
+        "long_10y": "DGS10"  # 10-Year Treasury Constant Maturity Rate
+    },
+    "JP": {
+        "policy": "IRLTLT01JPM156N",  # Long-Term Government Bond Yields: 10-year
+        "long_10y": "IRLTLT01JPM156N"  # 同じシリーズを使用
+    }
+}
 
 
 class RateFetcher(BaseFetcher):
@@ -24,24 +36,12 @@ class RateFetcher(BaseFetcher):
         super().__init__(market_code)
         self.rate_type = rate_type
         
-        # FRED APIキーの取得（環境変数から取得）
-        api_key = os.getenv("FRED_API_KEY")
-        if not api_key:
-            raise RuntimeError("FRED_API_KEYが設定されていません（GitHub Secretsを確認してください）")
-        
-        self.fred = Fred(api_key=api_key)
+        # FREDクライアント（プロセス内で共有）
+        self.fred = get_fred_client()
         
-        # シリーズIDのマッピング
-        self.series_ids = {
-            "US": {
-                "policy": "DFF",  # Federal Funds Effective Rate
-                "long_10y": "DGS10"  # 10-Year Treasury Constant Maturity Rate
-            },
-            "JP": {
-                "policy": "IRLTLT01JPM156N",  # Long-Term Government Bond Yields: 10-year
-                "long_10y": "IRLTLT01JPM156N"  # 同じシリーズを使用
-            }
-        }
+        # シリーズIDのマッピング（定数を共有し、この取得器のIDは一度だけ引く）
+        self.series_ids = SERIES_IDS
+        self.series_id = SERIES_IDS.get(market_code, {}).get(rate_type)
     
     def fetch(self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> pd.DataFrame:
         """
@@ -57,7 +57,7 @@ class RateFetcher(BaseFetcher):
                 - columns: ['rate']
         """
         try:
-            series_id = self.series_ids.get(self.market_code, {}).get(self.rate_type)
+            series_id = self.series_id
             if not series_id:
                 print(f"シリーズIDが見つかりません: {self.market_code}, {self.rate_type}")
                 return pd.DataFrame()
@@ -65,26 +65,79 @@ class RateFetcher(BaseFetcher):
             # FREDからデータ取得
             data = self.fred.get_series(series_id, start=start_date, end=end_date)
             
-            if data.empty:
-                return pd.DataFrame()
-            
-            # DataFrameに変換
-            column_name = "policy_rate" if self.rate_type == "policy" else "long_rate_10y"
-            df = pd.DataFrame({
-                column_name: data
-            })
-            
-            # 日付をindexに設定
-            if not isinstance(df.index, pd.DatetimeIndex):
-                df.index = pd.to_datetime(df.index)
-            
-            # 生データを保存
-            filename = "policy_rate" if self.rate_type == "policy" else "long_rate_10y"
-            self.save_raw_data(df, filename)
-            
-            return df
+            return self._to_frame(data)
             
         except Exception as e:
             print(f"金利データ取得エラー ({self.market_code}, {self.rate_type}): {e}")
             return pd.DataFrame()
-
+    
+    @classmethod
+    def fetch_many(cls, requests_: List[Tuple[str, str]], start_date: Optional[datetime] = None,
+                   end_date: Optional[datetime] = None) -> Dict[Tuple[str, str], pd.DataFrame]:
+        """
+        複数の金利データをスレッドで並列取得
+        
+        同じシリーズID（例: JPの政策金利と長期金利）は1回だけ取得する。
+        
+        Args:
+            requests_: (市場コード, 金利種別) のリスト
+            start_date: 開始日
+            end_date: 終了日
+        
+        Returns:
+            Dict[Tuple[str, str], DataFrame]: (市場コード, 金利種別) ごとの金利データ
+        """
+        fetchers = [cls(market_code, rate_type) for market_code, rate_type in requests_]
+        results = {}
+        
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            series_futures = {}
+            for fetcher in fetchers:
+                series_id = fetcher.series_id
+                if series_id and series_id not in series_futures:
+                    series_futures[series_id] = executor.submit(
+                        fetcher.fred.get_series, series_id, start=start_date, end=end_date
+                    )
+            
+            for fetcher in fetchers:
+                key = (fetcher.market_code, fetcher.rate_type)
+                series_id = fetcher.series_id
+                if not series_id:
+                    print(f"シリーズIDが見つかりません: {fetcher.market_code}, {fetcher.rate_type}")
+                    results[key] = pd.DataFrame()
+                    continue
+                try:
+                    results[key] = fetcher._to_frame(series_futures[series_id].result())
+                except Exception as e:
+                    print(f"金利データ取得エラー ({fetcher.market_code}, {fetcher.rate_type}): {e}")
+                    results[key] = pd.DataFrame()
+        
+        return results
+    
+    def _to_frame(self, data: pd.Series) -> pd.DataFrame:
+        """
+        取得したシリーズをDataFrameに変換して生データを保存
+        
+        Args:
+            data: FREDから取得したシリーズ
+        
+        Returns:
+            DataFrame: 金利データ
+        """
+        if data.empty:
+            return pd.DataFrame()
+        
+        # DataFrameに変換
+        column_name = "policy_rate" if self.rate_type == "policy" else "long_rate_10y"
+        df = self.build_float32_frame({
+            column_name: data
+        }, data.index)
+        
+        # 日付をindexに設定
+        self.ensure_datetime_index(df)
+        
+        # 生データを保存
+        filename = "policy_rate" if self.rate_type == "policy" else "long_rate_10y"
+        self.save_raw_data(df, filename)
+        
+        return df
@@ -7,6 +7,25 @@ from typing import Optional
 from src.facts.base_fact import BaseFact
 
 
+def format_data_period(start_date, end_date) -> str:
+    """
+    データ期間の文を生成（各Interpretationで共通）
+    
+    日付はstrftimeを使わずに直接組み立てる（書式文字列の解釈を省く）
+    
+    Args:
+        start_date: 開始日
+        end_date: 終了日
+    
+    Returns:
+        str: 「データ期間は…から…までです。」
+    """
+    return (
+        f"データ期間は{start_date.year:04d}年{start_date.month:02d}月{start_date.day:02d}日から"
+        f"{end_date.year:04d}年{end_date.month:02d}月{end_date.day:02d}日までです。"
+    )
+
+
 class BaseInterpretation(ABC):
     """Interpretationの基底クラス（文章要約のみ、判断は禁止）"""
     
@@ -1,7 +1,7 @@
 """
 CPI Interpretation
 """
-from src.interpretations.base_interpretation import BaseInterpretation
+from src.interpretations.base_interpretation import BaseInterpretation, format_data_period
 from src.facts.cpi_fact import CPIFact
 from datetime import datetime
 
@@ -31,7 +31,7 @@ class CPIIntepretation(BaseInterpretation):
         
         # データ期間
         if start_date and end_date:
-            summary_parts.append(f"データ期間は{start_date.strftime('%Y年%m月%d日')}から{end_date.strftime('%Y年%m月%d日')}までです。")
+            summary_parts.append(format_data_period(start_date, end_date))
         
         if not summary_parts:
             return "CPIデータの要約を生成できませんでした。"
@@ -1,7 +1,7 @@
 """
 EPS + PER Interpretation
 """
-from src.interpretations.base_interpretation import BaseInterpretation
+from src.interpretations.base_interpretation import BaseInterpretation, format_data_period
 from src.facts.eps_per_fact import EPSPERFact
 from datetime import datetime
 
@@ -36,7 +36,7 @@ class EPSPERInterpretation(BaseInterpretation):
         
         # データ期間
         if start_date and end_date:
-            summary_parts.append(f"データ期間は{start_date.strftime('%Y年%m月%d日')}から{end_date.strftime('%Y年%m月%d日')}までです。")
+            summary_parts.append(format_data_period(start_date, end_date))
         
         if not summary_parts:
             return "EPS/PERデータの要約を生成できませんでした。"
@@ -1,11 +1,29 @@
 """
 株価指数Interpretation
 """
-from src.interpretations.base_interpretation import BaseInterpretation
+from src.interpretations.base_interpretation import BaseInterpretation, format_data_period
 from src.facts.price_fact import PriceFact
 from datetime import datetime
 
 
+# 移動平均との位置関係（比較の符号 → 文。符号0で文がないものはNone）
+_PRICE_VS_MA20 = {
+    1: "株価は20日移動平均を上回っています。",
+    -1: "株価は20日移動平均を下回っています。",
+    0: "株価は20日移動平均とほぼ同水準です。",
+}
+_MA20_VS_MA75 = {
+    1: "20日移動平均は75日移動平均を上回っています。",
+    -1: "20日移動平均は75日移動平均を下回っています。",
+    0: None,
+}
+_MA75_VS_MA200 = {
+    1: "75日移動平均は200日移動平均を上回っています。",
+    -1: "75日移動平均は200日移動平均を下回っています。",
+    0: None,
+}
+
+
 class PriceInterpretation(BaseInterpretation):
     """株価指数のInterpretationクラス"""
     
@@ -34,29 +52,20 @@ class PriceInterpretation(BaseInterpretation):
             summary_parts.append(f"現在の株価は{current_price:,.0f}です。")
         
         # 移動平均との関係（事実のみ）
-        if current_price is not None and ma20 is not None:
-            if current_price > ma20:
-                summary_parts.append("株価は20日移動平均を上回っています。")
-            elif current_price < ma20:
-                summary_parts.append("株価は20日移動平均を下回っています。")
-            else:
-                summary_parts.append("株価は20日移動平均とほぼ同水準です。")
-        
-        if ma20 is not None and ma75 is not None:
-            if ma20 > ma75:
-                summary_parts.append("20日移動平均は75日移動平均を上回っています。")
-            elif ma20 < ma75:
-                summary_parts.append("20日移動平均は75日移動平均を下回っています。")
-        
-        if ma75 is not None and ma200 is not None:
-            if ma75 > ma200:
-                summary_parts.append("75日移動平均は200日移動平均を上回っています。")
-            elif ma75 < ma200:
-                summary_parts.append("75日移動平均は200日移動平均を下回っています。")
+        relations = (
+            (current_price, ma20, _PRICE_VS_MA20),
+            (ma20, ma75, _MA20_VS_MA75),
+            (ma75, ma200, _MA75_VS_MA200),
+        )
+        for left, right, sentences in relations:
+            if left is not None and right is not None:
+                sentence = sentences[(left > right) - (left < right)]
+                if sentence is not None:
+                    summary_parts.append(sentence)
         
         # データ期間
         if start_date and end_date:
-            summary_parts.append(f"データ期間は{start_date.strftime('%Y年%m月%d日')}から{end_date.strftime('%Y年%m月%d日')}までです。")
+            summary_parts.append(format_data_period(start_date, end_date))
         
         if not summary_parts:
             return "株価データの要約を生成できませんでした。"
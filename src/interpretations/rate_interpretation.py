@@ -1,7 +1,7 @@
 """
 政策金利・長期金利Interpretation
 """
-from src.interpretations.base_interpretation import BaseInterpretation
+from src.interpretations.base_interpretation import BaseInterpretation, format_data_period
 from src.facts.rate_fact import RateFact
 from datetime import datetime
 
@@ -34,7 +34,7 @@ class RateInterpretation(BaseInterpretation):
         
         # データ期間
         if start_date and end_date:
-            summary_parts.append(f"データ期間は{start_date.strftime('%Y年%m月%d日')}から{end_date.strftime('%Y年%m月%d日')}までです。")
+            summary_parts.append(format_data_period(start_date, end_date))
         
         if not summary_parts:
             return f"{rate_type_name}データの要約を生成できませんでした。"
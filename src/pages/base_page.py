@@ -3,8 +3,8 @@
 """
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, Tuple
-import yaml
 import os
+from .config_loader import load_config_entry, load_yaml_config
 from datetime import datetime, timedelta
 
 
@@ -22,28 +22,21 @@ class BasePage(ABC):
         self._load_configs()
     
     def _load_configs(self):
-        """設定ファイルを読み込む"""
+        """設定ファイルを読み込む（パース結果はプロセス内でキャッシュ）"""
         config_dir = "config"
         
         # 市場設定
-        with open(os.path.join(config_dir, "markets.yaml"), "r", encoding="utf-8") as f:
-            markets_config = yaml.safe_load(f)
-            self.market_config = next(
-                (m for m in markets_config["markets"] if m["code"] == self.market_code),
-                None
-            )
+        self.market_config = load_config_entry(
+            os.path.join(config_dir, "markets.yaml"), "markets", self.market_code
+        )
         
         # 期間設定
-        with open(os.path.join(config_dir, "timeframes.yaml"), "r", encoding="utf-8") as f:
-            timeframes_config = yaml.safe_load(f)
-            self.timeframe_config = next(
-                (t for t in timeframes_config["timeframes"] if t["code"] == self.timeframe_code),
-                None
-            )
+        self.timeframe_config = load_config_entry(
+            os.path.join(config_dir, "timeframes.yaml"), "timeframes", self.timeframe_code
+        )
         
         # 指標設定
-        with open(os.path.join(config_dir, "indicators.yaml"), "r", encoding="utf-8") as f:
-            self.indicators_config = yaml.safe_load(f)
+        self.indicators_config = load_yaml_config(os.path.join(config_dir, "indicators.yaml"))
     
     def get_years(self) -> int:
         """デフォルトの表示年数を取得"""
@@ -0,0 +1,87 @@
+"""
+設定ファイル（YAML）の読み込み
+同じファイルの再パースを避けるため、パース結果をキャッシュする
+"""
+import copy
+import os
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import yaml
+
+# libyamlがあればCローダーを使う（なければ純Python実装）
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime: float, size: int) -> Any:
+    """
+    YAMLファイルをパース（パス・更新時刻・サイズをキーにキャッシュ）
+
+    Args:
+        path: ファイルパス
+        mtime: 更新時刻（ファイル変更時にキャッシュを無効化するためのキー）
+        size: ファイルサイズ（同上）
+
+    Returns:
+        Any: パース結果
+    """
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def load_yaml_config(path: str) -> Any:
+    """
+    YAML設定ファイルを読み込む
+
+    ファイルが変更されていなければキャッシュ済みのパース結果を返す。
+    呼び出し側での変更がキャッシュに波及しないよう、コピーを返す。
+
+    Args:
+        path: ファイルパス
+
+    Returns:
+        Any: パース結果のコピー
+    """
+    st = os.stat(path)
+    return copy.deepcopy(_load_yaml_cached(path, st.st_mtime, st.st_size))
+
+
+@lru_cache(maxsize=32)
+def _index_yaml_cached(path: str, mtime: float, size: int, list_key: str) -> Dict[str, Any]:
+    """
+    YAMLファイル内のリストをcodeで引ける辞書にする（キーは_load_yaml_cachedと同じ＋リスト名）
+
+    Args:
+        path: ファイルパス
+        mtime: 更新時刻
+        size: ファイルサイズ
+        list_key: codeを持つ要素のリストのキー（"markets" など）
+
+    Returns:
+        Dict[str, Any]: code → 要素（同じcodeが複数あれば先頭の要素）
+    """
+    index = {}
+    for entry in _load_yaml_cached(path, mtime, size)[list_key]:
+        index.setdefault(entry["code"], entry)
+    return index
+
+
+def load_config_entry(path: str, list_key: str, code: str) -> Optional[Dict[str, Any]]:
+    """
+    YAML設定ファイルのリストからcodeが一致する要素を取得する
+
+    ページごとに設定全体をコピーしてリストを先頭から探す代わりに、
+    codeの辞書をキャッシュしておき、該当する要素だけをコピーして返す。
+
+    Args:
+        path: ファイルパス
+        list_key: 要素のリストのキー（"markets" / "timeframes"）
+        code: 要素のcode
+
+    Returns:
+        Optional[Dict[str, Any]]: 要素のコピー（見つからなければNone）
+    """
+    st = os.stat(path)
+    entry = _index_yaml_cached(path, st.st_mtime, st.st_size, list_key).get(code)
+    return copy.deepcopy(entry) if entry is not None else None
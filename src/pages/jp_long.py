@@ -8,8 +8,5 @@ class JPLongPage(USShortPage):
     """日本 - 長期ページクラス"""
     
     def __init__(self):
-        super().__init__()
-        self.market_code = "JP"
-        self.timeframe_code = "long"
-        self._load_configs()
+        super().__init__("JP", "long")
 
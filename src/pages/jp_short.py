@@ -8,8 +8,5 @@ class JPShortPage(USShortPage):
     """日本 - 短期ページクラス"""
     
     def __init__(self):
-        super().__init__()
-        self.market_code = "JP"
-        self.timeframe_code = "short"
-        self._load_configs()
+        super().__init__("JP", "short")
 
@@ -8,7 +8,5 @@ class USLongPage(USShortPage):
     """米国 - 長期ページクラス"""
     
     def __init__(self):
-        super().__init__()
-        self.timeframe_code = "long"
-        self._load_configs()
+        super().__init__("US", "long")
 
@@ -8,7 +8,5 @@ class USMediumPage(USShortPage):
     """米国 - 中期ページクラス"""
     
     def __init__(self):
-        super().__init__()
-        self.timeframe_code = "medium"
-        self._load_configs()
+        super().__init__("US", "medium")
 
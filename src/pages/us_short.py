@@ -19,18 +19,46 @@ from src.charts.price_chart import PriceChart
 from src.charts.rate_chart import RateChart
 from src.charts.cpi_chart import CPIChart
 from src.charts.eps_per_chart import EPSPERChart
+from src.renderer.layout import NO_DATA_HTML
 
 
 class USShortPage(BasePage):
     """米国 - 短期ページクラス"""
     
-    def __init__(self):
-        super().__init__("US", "short")
+    # データを取得できなかった指標の解釈文（チャート欄はNO_DATA_HTMLで共通）
+    _NO_DATA_INTERPRETATIONS = {
+        "price": "株価データは現在取得できません。",
+        "rate": "金利データは現在取得できません。",
+        "cpi": "CPIデータは現在取得できません。",
+        "eps_per": "EPS/PERデータは現在取得できません。",
+    }
+    
+    def __init__(self, market_code: str = "US", timeframe_code: str = "short"):
+        """
+        Args:
+            market_code: 市場コード（他の市場・期間のページはこのクラスを継承してコードだけ渡す）
+            timeframe_code: 期間コード
+        """
+        super().__init__(market_code, timeframe_code)
+    
+    @classmethod
+    def _set_no_data(cls, result: Dict[str, Any], key: str) -> None:
+        """
+        データを取得できなかった指標のチャートと解釈をフォールバック表示にする
+        
+        Args:
+            result: build()で組み立て中のページデータ
+            key: 指標のキー（price / rate / cpi / eps_per）
+        """
+        result["charts"][key] = NO_DATA_HTML
+        result["interpretations"][key] = cls._NO_DATA_INTERPRETATIONS[key]
     
     def build(self) -> Dict[str, Any]:
         """ページを組み立てる"""
         years = self.get_years()
         switchable_years = self.get_switchable_years()
+        # 複数期間データの期間（株価・金利・CPIで共通）
+        all_periods = sorted(set([years] + switchable_years))
         start_date, end_date = self.get_date_range()
         
         # 市場設定からシンボルを取得
@@ -40,10 +68,11 @@ class USShortPage(BasePage):
             None
         )
         symbol = symbol_config["symbol"] if symbol_config else "^GSPC"
+        market_name = self.market_config.get("name", "米国")
         
         result = {
             "market_code": self.market_code,
-            "market_name": self.market_config.get("name", "米国"),
+            "market_name": market_name,
             "timeframe_code": self.timeframe_code,
             "timeframe_name": self.timeframe_config.get("name", "短期"),
             "years": years,
@@ -70,50 +99,41 @@ class USShortPage(BasePage):
                     "symbol": symbol
                 }
                 
-                price_chart = PriceChart(self.market_config.get("name", "米国"), price_index)
+                price_chart = PriceChart(market_name, price_index)
                 # 憲法準拠：複数期間データを生成
-                all_periods = sorted(set([years] + switchable_years))
                 multi_period_data = price_chart.create_multi_period_data(price_data, all_periods)
                 result["chart_data"]["price"] = multi_period_data
-                # 初期表示用のチャートHTML（最初の期間）
-                if multi_period_data:
-                    first_period = min(multi_period_data.keys())
-                    chart_fig = price_chart.create_chart(price_data, first_period, switchable_years)
-                    result["charts"]["price"] = price_chart.to_html(chart_fig, "price-chart")
-                else:
-                    result["charts"]["price"] = price_chart.to_html(None, "price-chart")
+                # 初期表示用の描画先div（描画は複数期間データからページ末尾のスクリプトで行う）
+                result["charts"]["price"] = price_chart.to_html(
+                    "price-chart", price_chart.get_initial_height(multi_period_data)
+                )
                 
                 price_interpretation = PriceInterpretation(price_fact)
                 result["interpretations"]["price"] = price_interpretation.generate_summary()
             else:
-                result["charts"]["price"] = "<p>この指標は現在データを取得できません</p>"
-                result["interpretations"]["price"] = "株価データは現在取得できません。"
+                self._set_no_data(result, "price")
         except Exception as e:
             print(f"株価チャート生成エラー: {e}")
-            result["charts"]["price"] = "<p>この指標は現在データを取得できません</p>"
-            result["interpretations"]["price"] = "株価データは現在取得できません。"
+            self._set_no_data(result, "price")
         
         # ② 政策金利 + 長期金利チャート
         try:
-            policy_fetcher = RateFetcher(self.market_code, "policy")
-            long_rate_fetcher = RateFetcher(self.market_code, "long_10y")
-            
-            policy_data = policy_fetcher.fetch(start_date, end_date)
-            long_rate_data = long_rate_fetcher.fetch(start_date, end_date)
+            # 政策金利と長期金利を並列取得
+            rate_results = RateFetcher.fetch_many(
+                [(self.market_code, "policy"), (self.market_code, "long_10y")], start_date, end_date
+            )
+            policy_data = rate_results[(self.market_code, "policy")]
+            long_rate_data = rate_results[(self.market_code, "long_10y")]
             
             if not policy_data.empty or not long_rate_data.empty:
-                rate_chart = RateChart(self.market_config.get("name", "米国"))
+                rate_chart = RateChart(market_name)
                 # 憲法準拠：複数期間データを生成
-                all_periods = sorted(set([years] + switchable_years))
                 multi_period_data = rate_chart.create_multi_period_data(policy_data, long_rate_data, all_periods)
                 result["chart_data"]["rate"] = multi_period_data
-                # 初期表示用のチャートHTML（最初の期間）
-                if multi_period_data:
-                    first_period = min(multi_period_data.keys())
-                    chart_fig = rate_chart.create_chart(policy_data, long_rate_data, first_period)
-                    result["charts"]["rate"] = rate_chart.to_html(chart_fig, "rate-chart")
-                else:
-                    result["charts"]["rate"] = rate_chart.to_html(None, "rate-chart")
+                # 初期表示用の描画先div
+                result["charts"]["rate"] = rate_chart.to_html(
+                    "rate-chart", rate_chart.get_initial_height(multi_period_data)
+                )
                 
                 # 解釈（政策金利と長期金利の両方）
                 interpretations = []
@@ -141,12 +161,10 @@ class USShortPage(BasePage):
                 
                 result["interpretations"]["rate"] = " ".join(interpretations)
             else:
-                result["charts"]["rate"] = "<p>この指標は現在データを取得できません</p>"
-                result["interpretations"]["rate"] = "金利データは現在取得できません。"
+                self._set_no_data(result, "rate")
         except Exception as e:
             print(f"金利チャート生成エラー: {e}")
-            result["charts"]["rate"] = "<p>この指標は現在データを取得できません</p>"
-            result["interpretations"]["rate"] = "金利データは現在取得できません。"
+            self._set_no_data(result, "rate")
         
         # ③ CPIチャート
         try:
@@ -163,28 +181,22 @@ class USShortPage(BasePage):
                     "data": cpi_data
                 }
                 
-                cpi_chart = CPIChart(self.market_config.get("name", "米国"))
+                cpi_chart = CPIChart(market_name)
                 # 憲法準拠：複数期間データを生成
-                all_periods = sorted(set([years] + switchable_years))
                 multi_period_data = cpi_chart.create_multi_period_data(cpi_data, all_periods)
                 result["chart_data"]["cpi"] = multi_period_data
-                # 初期表示用のチャートHTML（最初の期間）
-                if multi_period_data:
-                    first_period = min(multi_period_data.keys())
-                    chart_fig = cpi_chart.create_chart(cpi_data, first_period)
-                    result["charts"]["cpi"] = cpi_chart.to_html(chart_fig, "cpi-chart")
-                else:
-                    result["charts"]["cpi"] = cpi_chart.to_html(None, "cpi-chart")
+                # 初期表示用の描画先div
+                result["charts"]["cpi"] = cpi_chart.to_html(
+                    "cpi-chart", cpi_chart.get_initial_height(multi_period_data)
+                )
                 
                 cpi_interpretation = CPIIntepretation(cpi_fact)
                 result["interpretations"]["cpi"] = cpi_interpretation.generate_summary()
             else:
-                result["charts"]["cpi"] = "<p>この指標は現在データを取得できません</p>"
-                result["interpretations"]["cpi"] = "CPIデータは現在取得できません。"
+                self._set_no_data(result, "cpi")
         except Exception as e:
             print(f"CPIチャート生成エラー: {e}")
-            result["charts"]["cpi"] = "<p>この指標は現在データを取得できません</p>"
-            result["interpretations"]["cpi"] = "CPIデータは現在取得できません。"
+            self._set_no_data(result, "cpi")
         
         # ④ EPS + PERチャート（20年固定）
         try:
@@ -195,23 +207,22 @@ class USShortPage(BasePage):
                 eps_per_fact = EPSPERFact(self.market_code)
                 eps_per_fact.load_data(eps_per_data)
                 
-                eps_per_chart = EPSPERChart(self.market_config.get("name", "米国"))
+                eps_per_chart = EPSPERChart(market_name)
                 # 憲法準拠：複数期間データを生成（EPS/PERは20年固定）
                 multi_period_data = eps_per_chart.create_multi_period_data(eps_per_data)
                 result["chart_data"]["eps_per"] = multi_period_data
-                # 初期表示用のチャートHTML
-                chart_fig = eps_per_chart.create_chart(eps_per_data)
-                result["charts"]["eps_per"] = eps_per_chart.to_html(chart_fig, "eps-per-chart")
+                # 初期表示用の描画先div
+                result["charts"]["eps_per"] = eps_per_chart.to_html(
+                    "eps-per-chart", eps_per_chart.get_initial_height(multi_period_data)
+                )
                 
                 eps_per_interpretation = EPSPERInterpretation(eps_per_fact)
                 result["interpretations"]["eps_per"] = eps_per_interpretation.generate_summary()
             else:
-                result["charts"]["eps_per"] = "<p>この指標は現在データを取得できません</p>"
-                result["interpretations"]["eps_per"] = "EPS/PERデータは現在取得できません。"
+                self._set_no_data(result, "eps_per")
         except Exception as e:
             print(f"EPS/PERチャート生成エラー: {e}")
-            result["charts"]["eps_per"] = "<p>この指標は現在データを取得できません</p>"
-            result["interpretations"]["eps_per"] = "EPS/PERデータは現在取得できません。"
+            self._set_no_data(result, "eps_per")
         
         return result
 
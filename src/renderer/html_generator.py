@@ -1,39 +1,168 @@
 """
 HTML生成
 """
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Optional, Tuple
+from collections import OrderedDict
 from datetime import datetime
-from .layout import Layout
+import json
+from .layout import Layout, MARKETS, TIMEFRAMES
 from .section import SectionRenderer
+from .template import Fragment, Markup, escape, get_template
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# <script>内に埋め込むJSONのエスケープ（"</script>" や "<!--" で途切れないようにする）
+_SCRIPT_JSON_ESCAPE = str.maketrans({"<": "\\u003c"})
+
+
+def _dump_json(obj: Any) -> str:
+    """
+    <script>埋め込み用にJSONへ変換（orjsonがあれば使用）
+    
+    NumPyの値はorjsonでも数値として出力する（標準のjsonと出力をそろえる）
+    
+    Args:
+        obj: 変換対象
+    
+    Returns:
+        str: JSON文字列
+    """
+    if ORJSON_AVAILABLE:
+        dumped = orjson.dumps(
+            obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode("utf-8")
+    else:
+        # orjsonと同じく区切りの空白を入れない
+        dumped = json.dumps(obj, ensure_ascii=False, default=str, separators=(",", ":"))
+    return dumped.translate(_SCRIPT_JSON_ESCAPE)
+
+
+# チャートデータごとのJSON（id → (元のオブジェクト, JSON文字列)）
+# create_multi_period_data の結果はキャッシュから同じオブジェクトが返るため、
+# 同じ市場の複数ページで使い回されるチャートデータは1回だけ変換する
+_CHART_JSON_CACHE: "OrderedDict[int, Tuple[Any, str]]" = OrderedDict()
+CHART_JSON_CACHE_SIZE = 64
+
+
+def _dump_chart_data_json(chart_data: Dict[str, Any]) -> str:
+    """
+    チャートデータ（チャート種別 → 複数期間データ）をJSONへ変換（同じオブジェクトは変換結果を再利用）
+    
+    Args:
+        chart_data: チャートデータ
+    
+    Returns:
+        str: JSON文字列（_dump_json(chart_data) と同じ内容）
+    """
+    items = []
+    for key, value in chart_data.items():
+        cached = _CHART_JSON_CACHE.get(id(value))
+        # 元のオブジェクトを保持しているので、同じidなら同じオブジェクト
+        if cached is not None and cached[0] is value:
+            _CHART_JSON_CACHE.move_to_end(id(value))
+            dumped = cached[1]
+        else:
+            dumped = _dump_json(value)
+            _CHART_JSON_CACHE[id(value)] = (value, dumped)
+            if len(_CHART_JSON_CACHE) > CHART_JSON_CACHE_SIZE:
+                _CHART_JSON_CACHE.popitem(last=False)
+        items.append(f"{_dump_json(str(key))}:{dumped}")
+    return "{" + ",".join(items) + "}"
+
+
+# ヒートマップの方向（前日比の符号 → 方向）
+_DIRECTION_BY_SIGN = {1: "up", -1: "down", 0: "flat"}
+
+# インデックスページのレポート一覧（市場 × 期間。選択UIと同じ選択肢から組み立てる）
+_INDEX_LINK_ITEMS = "\n".join([
+    f'<li><a href="logs/{market_code}-{timeframe_code}.html" class="report-link">'
+    f'{escape(f"{market_name} - {timeframe_name}")}</a></li>'
+    for market_code, market_name in MARKETS
+    for timeframe_code, timeframe_name in TIMEFRAMES
+])
 
 
 class HTMLGenerator:
     """HTMLを生成するクラス"""
     
     @staticmethod
-    def generate_page_html(page_data: Dict[str, Any]) -> str:
+    def generate_page_html(page_data: Dict[str, Any], generated_at: Optional[str] = None) -> str:
         """
         ページHTMLを生成（CSP準拠、UI改善版）
         
         Args:
             page_data: ページデータ
+            generated_at: 生成日時（"%Y-%m-%d %H:%M:%S"形式。省略時は現在時刻）
         
         Returns:
             str: HTML文字列
         """
+        return "".join(HTMLGenerator.iter_page_html(page_data, generated_at))
+    
+    @staticmethod
+    def iter_page_html(page_data: Dict[str, Any], generated_at: Optional[str] = None) -> Iterator[str]:
+        """
+        ページHTMLを断片ごとに生成（ページ全体を1つの文字列に結合せずにファイルへ書き込むため）
+        
+        Args:
+            page_data: ページデータ
+            generated_at: 生成日時（"%Y-%m-%d %H:%M:%S"形式。省略時は現在時刻）
+        
+        Yields:
+            str: HTML断片
+        """
+        yield from Layout.iter_base_html(*HTMLGenerator._build_page_parts(page_data, generated_at))
+    
+    @staticmethod
+    def iter_page_bytes(page_data: Dict[str, Any], generated_at: Optional[str] = None) -> Iterator[bytes]:
+        """
+        ページHTMLをUTF-8バイト列の断片ごとに生成（バイナリモードでそのまま書き込むため）
+        
+        Args:
+            page_data: ページデータ
+            generated_at: 生成日時（"%Y-%m-%d %H:%M:%S"形式。省略時は現在時刻）
+        
+        Yields:
+            bytes: HTML断片
+        """
+        yield from Layout.iter_base_bytes(*HTMLGenerator._build_page_parts(page_data, generated_at))
+    
+    @staticmethod
+    def _build_page_parts(page_data: Dict[str, Any], generated_at: Optional[str]) -> Tuple[str, Fragment, Fragment]:
+        """
+        ベースHTMLに差し込むタイトル・コンテンツ・スクリプトを生成
+        
+        Args:
+            page_data: ページデータ
+            generated_at: 生成日時（省略時は現在時刻）
+        
+        Returns:
+            Tuple[str, Fragment, Fragment]: (タイトル, コンテンツ, スクリプトタグ)
+        """
         market_name = page_data.get("market_name", "")
         timeframe_name = page_data.get("timeframe_name", "")
         market_code = page_data.get("market_code", "US")
         timeframe_code = page_data.get("timeframe_code", "short")
         
+        # 生成日時（ヘッダーに直接埋め込む）
+        if generated_at is None:
+            generated_at = HTMLGenerator.format_generated_at()
+        
         # ヘッダー（市場・期間選択UIを含む）
-        header = Layout.get_header(market_name, timeframe_name, market_code, timeframe_code)
+        header = Layout.get_header(market_name, timeframe_name, market_code, timeframe_code, generated_at)
         
         # セクション（すべて常時表示）
         sections = []
         
+        # 終値はセクション（fact-list・方向矢印）とヒートマップで共用する
+        close_values = SectionRenderer._valid_values(page_data, "price", "Close")
+        
         # ① 株価指数チャート
-        sections.append(SectionRenderer.render_price_section(page_data))
+        sections.append(SectionRenderer.render_price_section(page_data, close_values))
         
         # ② 政策金利 + 長期金利
         sections.append(SectionRenderer.render_rate_section(page_data))
@@ -44,157 +173,91 @@ class HTMLGenerator:
         # ④ EPS + PER
         sections.append(SectionRenderer.render_eps_per_section(page_data))
         
-        # コンテンツ結合（ダッシュボード型レイアウト）
-        sections_html = "\n".join(sections)
-        content = header + f'<div class="dashboard">\n{sections_html}\n</div>'
+        # コンテンツ（ダッシュボード型レイアウト。ページの断片の間で展開する）
+        content = Fragment(get_template("dashboard.html"), {
+            "header": Markup(header),
+            "sections": Markup("\n".join(sections)),
+        })
         
         # FactデータをJSON形式で埋め込み（ヒートマップ用）
-        import json
-        import pandas as pd
-        
         heatmap_data = []
         facts = page_data.get("facts", {})
         
         # 株価データからヒートマップ用データを生成
         price_fact = facts.get("price")
-        if price_fact and price_fact.get("is_valid"):
-            price_data = price_fact.get("data")
+        if close_values is not None and len(close_values) >= 2:
             symbol = price_fact.get("symbol", "")
-            if price_data is not None and not price_data.empty and "Close" in price_data.columns:
-                close_values = price_data["Close"].dropna()
-                if len(close_values) >= 2:
-                    current = float(close_values.iloc[-1])
-                    previous = float(close_values.iloc[-2])
-                    change_pct = ((current - previous) / previous) * 100 if previous != 0 else 0
-                    
-                    # 変化率の絶対値で弱/中/強を判定
-                    abs_change = abs(change_pct)
-                    if abs_change < 1.0:
-                        strength = "weak"
-                    elif abs_change < 3.0:
-                        strength = "mid"
-                    else:
-                        strength = "strong"
-                    
-                    direction = "up" if change_pct > 0 else "down" if change_pct < 0 else "flat"
-                    
-                    heatmap_data.append({
-                        "symbol": symbol,
-                        "direction": direction,
-                        "strength": strength,
-                        "change_pct": round(change_pct, 2)
-                    })
-        
-        # JSONデータをスクリプトタグに埋め込み
-        heatmap_json = json.dumps(heatmap_data, ensure_ascii=False)
-        heatmap_script = f'<script>window.heatmapData = {heatmap_json};</script>'
-        
-        # 憲法準拠：複数期間チャートデータをJSON形式で埋め込み
-        multi_period_chart_data = page_data.get("chart_data", {})
-        chart_data_json = json.dumps(multi_period_chart_data, ensure_ascii=False, default=str)
-        chart_data_script = f'<script>window.multiPeriodChartData = {chart_data_json};</script>'
-        
-        # 憲法準拠：初期表示用のPlotly.newPlot()スクリプトを生成（Plotly読み込み後に実行）
-        init_chart_script = '<script>'
-        init_chart_script += 'function initCharts() {'
-        init_chart_script += '  if (typeof Plotly === "undefined" || !window.multiPeriodChartData) {'
-        init_chart_script += '    setTimeout(initCharts, 100);'
-        init_chart_script += '    return;'
-        init_chart_script += '  }'
-        init_chart_script += '  const chartTypes = ["price", "rate", "cpi", "eps_per"];'
-        init_chart_script += '  const chartIds = {"price": "price-chart", "rate": "rate-chart", "cpi": "cpi-chart", "eps_per": "eps-per-chart"};'
-        init_chart_script += '  chartTypes.forEach(function(chartType) {'
-        init_chart_script += '    const chartData = window.multiPeriodChartData[chartType];'
-        init_chart_script += '    if (chartData) {'
-        init_chart_script += '      const periods = Object.keys(chartData).map(Number).sort((a, b) => a - b);'
-        init_chart_script += '      if (periods.length > 0) {'
-        init_chart_script += '        const firstPeriod = periods[0];'
-        init_chart_script += '        const periodData = chartData[firstPeriod];'
-        init_chart_script += '        const chartId = chartIds[chartType];'
-        init_chart_script += '        const chartDiv = document.getElementById(chartId);'
-        init_chart_script += '        if (chartDiv && periodData && periodData.traces && periodData.layout) {'
-        init_chart_script += '          Plotly.newPlot(chartId, periodData.traces, periodData.layout, {responsive: true});'
-        init_chart_script += '        }'
-        init_chart_script += '      }'
-        init_chart_script += '    }'
-        init_chart_script += '  });'
-        init_chart_script += '}'
-        init_chart_script += 'if (document.readyState === "loading") {'
-        init_chart_script += '  document.addEventListener("DOMContentLoaded", initCharts);'
-        init_chart_script += '} else {'
-        init_chart_script += '  initCharts();'
-        init_chart_script += '}'
-        init_chart_script += '</script>'
-        
-        # ベースHTML生成
-        title = f"{market_name} - {timeframe_name}市場レポート"
-        html = Layout.get_base_html(title, content)
+            current = float(close_values[-1])
+            previous = float(close_values[-2])
+            change_pct = ((current - previous) / previous) * 100 if previous != 0 else 0
+            
+            # 変化率の絶対値で弱/中/強を判定
+            abs_change = abs(change_pct)
+            if abs_change < 1.0:
+                strength = "weak"
+            elif abs_change < 3.0:
+                strength = "mid"
+            else:
+                strength = "strong"
+            
+            direction = _DIRECTION_BY_SIGN[(change_pct > 0) - (change_pct < 0)]
+            
+            heatmap_data.append({
+                "symbol": symbol,
+                "direction": direction,
+                "strength": strength,
+                "change_pct": round(change_pct, 2)
+            })
         
-        # 生成日時を取得して置換
-        generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        html = html.replace(
-            "<!--REPORT_TIMESTAMP-->",
-            f'<div class="report-generated">Generated at: {generated_at}</div>'
-        )
+        # 埋め込みスクリプト（ヒートマップ用データ・複数期間チャートデータ・初期表示用のPlotly.newPlot()）
+        # 憲法準拠：Plotly.newPlot()はPlotly読み込み後に1回だけ実行
+        # チャートデータのJSONは大きいため、スクリプト全体を1つの文字列に結合せずに展開する
+        scripts = Fragment(get_template("report_scripts.html"), {
+            "heatmap_json": Markup(_dump_json(heatmap_data)),
+            "chart_data_json": Markup(_dump_chart_data_json(page_data.get("chart_data", {}))),
+        })
         
-        # スクリプトタグをbodyの最後に追加
-        html = html.replace('</body>', f'{heatmap_script}\n{chart_data_script}\n{init_chart_script}</body>')
+        # ベースHTML生成（スクリプトタグはbodyの最後に追加）
+        title = f"{market_name} - {timeframe_name}市場レポート"
+        return title, content, scripts
+    
+    @staticmethod
+    def format_generated_at(now: Optional[datetime] = None) -> str:
+        """
+        生成日時の表示文字列を作る
         
-        return html
+        Args:
+            now: 日時（省略時は現在時刻）
+        
+        Returns:
+            str: "%Y-%m-%d %H:%M:%S"形式の文字列
+        """
+        if now is None:
+            now = datetime.now()
+        return now.strftime("%Y-%m-%d %H:%M:%S")
     
     @staticmethod
-    def generate_index_html() -> str:
+    def generate_index_html(generated_at: Optional[str] = None) -> str:
         """
         インデックスページを生成（CSP準拠）
         
+        Args:
+            generated_at: 生成日時（各レポートページと同じ値を渡す。省略時は現在時刻）
+        
         Returns:
             str: HTML文字列
         """
-        links = [
-            ("US-short.html", "米国 - 短期"),
-            ("US-medium.html", "米国 - 中期"),
-            ("US-long.html", "米国 - 長期"),
-            ("JP-short.html", "日本 - 短期"),
-            ("JP-medium.html", "日本 - 中期"),
-            ("JP-long.html", "日本 - 長期"),
-        ]
-        
-        link_items = "\n".join([
-            f'<li><a href="logs/{filename}" class="report-link">{name}</a></li>'
-            for filename, name in links
-        ])
-        
-        content = f"""<header>
-            <h1>v2 Market Report</h1>
-            <p class="subtitle">実データに基づく市場分析レポート</p>
-        </header>
-        <div class="section">
-            <h2 class="section-title">レポート一覧</h2>
-            <ul class="report-list">
-                {link_items}
-            </ul>
-        </div>"""
+        if generated_at is None:
+            generated_at = HTMLGenerator.format_generated_at()
+        report_timestamp = f'<div class="report-generated">Generated at: {escape(generated_at)}</div>'
+        
+        content = get_template("index_content.html").render({
+            "link_items": Markup(_INDEX_LINK_ITEMS),
+            "report_timestamp": Markup(report_timestamp),
+        })
         
         # インデックスページはルートなので、パスを調整
         # Skeleton UIを含まないベースHTMLを生成
-        html = f"""<!DOCTYPE html>
-<html lang="ja">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta http-equiv="Content-Security-Policy" content="default-src 'self'; script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.plot.ly; style-src 'self' 'unsafe-inline' https://fonts.googleapis.com; font-src 'self' https://fonts.gstatic.com; img-src 'self' data: https:; connect-src 'self' https://api.github.com;">
-    <title>v2 Market Report - インデックス</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&family=Noto+Sans+JP:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="assets/css/main.css">
-</head>
-<body>
-    <div class="container">
-        {content}
-    </div>
-    <script src="assets/js/main.js"></script>
-</body>
-</html>"""
+        html = get_template("index.html").render({"content": content})
         return html
 
@@ -1,54 +1,196 @@
 """
 HTMLレイアウト
 """
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Iterator, Optional, Tuple
+from .template import Fragment, Markup, escape, get_template
+
+
+# チャートが取得できない場合の表示
+NO_DATA_HTML = "<p>この指標は現在データを取得できません</p>"
+
+
+# 市場・期間選択UIの選択肢
+MARKETS = (
+    ("US", "米国"),
+    ("JP", "日本")
+)
+
+TIMEFRAMES = (
+    ("short", "短期"),
+    ("medium", "中期"),
+    ("long", "長期")
+)
+
+
+def _build_selector(items: tuple, kind: str, current: str) -> str:
+    """
+    選択UIを生成
+    
+    Args:
+        items: (コード, 表示名) のタプル
+        kind: 種別（"market" or "timeframe"）。クラス名・data属性に使う
+        current: 現在選択中のコード
+    
+    Returns:
+        str: HTML文字列
+    """
+    buttons = []
+    for code, name in items:
+        active_class = "active" if code == current else ""
+        buttons.append(
+            f'<button class="{kind}-btn {active_class}" data-{kind}="{code}">{name}</button>'
+        )
+    
+    return f'<div class="{kind}-selector">{"".join(buttons)}</div>'
+
+
+@lru_cache(maxsize=64)
+def _build_period_selector(years: int, switchable_years: Tuple[int, ...], chart_id: str) -> str:
+    """
+    期間選択UIを生成（同じ年数・チャートの組み合わせはページをまたいで使い回す）
+    
+    Args:
+        years: 現在の年数
+        switchable_years: 切替可能な年数
+        chart_id: チャートID
+    
+    Returns:
+        str: HTML文字列
+    """
+    buttons = []
+    all_years = sorted(set((years,) + switchable_years))
+    
+    for y in all_years:
+        active_class = "active" if y == years else ""
+        buttons.append(
+            f'<button class="period-btn {active_class}" data-years="{y}" data-chart-id="{chart_id}">{y}年</button>'
+        )
+    
+    return f'<div class="period-selector">{"".join(buttons)}</div>'
+
+
+# チャート種別 → チャートコンテナの属性、ブロック → セクションのクラス
+# （どちらも選択肢が固定なので事前に組み立てておく）
+_CHART_CONTAINER_ATTRS = {
+    chart_type: Markup(f' data-chart-type="{chart_type}"')
+    for chart_type in ("price", "rate", "cpi", "eps_per")
+}
+_CHART_CONTAINER_ATTRS[""] = Markup("")
+
+_SECTION_CLASSES = {f"block-{i}": Markup(f"card block-{i}") for i in range(1, 5)}
+_SECTION_CLASSES[""] = Markup("card")
+
+
+# タイトルに含まれる語 → チャート種別（上から順に判定）
+_CHART_TYPE_KEYWORDS = (
+    (("株価指数", "①"), "price"),
+    (("政策金利", "長期金利", "②"), "rate"),
+    (("CPI", "③"), "cpi"),
+    (("EPS", "PER", "④"), "eps_per"),
+)
+
+
+@lru_cache(maxsize=64)
+def _chart_type_for_title(title: str) -> str:
+    """
+    セクションタイトルからチャート種別を判定（タイトルは固定なので判定結果を使い回す）
+    
+    Args:
+        title: セクションタイトル
+    
+    Returns:
+        str: チャート種別（該当なしは空文字）
+    """
+    for keywords, chart_type in _CHART_TYPE_KEYWORDS:
+        if any(keyword in title for keyword in keywords):
+            return chart_type
+    return ""
+
+
+def _as_markup(value: Any) -> Any:
+    """
+    生成済みHTMLをMarkupにする（Fragmentは展開せずにそのまま渡す）
+    
+    Args:
+        value: HTML文字列またはFragment
+    
+    Returns:
+        Any: MarkupまたはFragment
+    """
+    if type(value) is Fragment:
+        return value
+    return Markup(value)
+
+
+# 生成日時を後から置換するためのマーカー
+REPORT_TIMESTAMP_MARKER = "<!--REPORT_TIMESTAMP-->"
+
+
+# 選択状態ごとの選択UI（選択肢は固定なので事前に組み立てておく）
+_MARKET_SELECTOR_HTML = {code: _build_selector(MARKETS, "market", code) for code, _ in MARKETS}
+_TIMEFRAME_SELECTOR_HTML = {code: _build_selector(TIMEFRAMES, "timeframe", code) for code, _ in TIMEFRAMES}
 
 
 class Layout:
     """HTMLレイアウトクラス"""
     
     @staticmethod
-    def get_base_html(title: str, content: str) -> str:
+    def get_base_html(title: str, content: str, scripts: str = "") -> str:
         """
         ベースHTMLを生成（CSP準拠：外部CSS/JSファイルを使用）
         
         Args:
             title: ページタイトル
-            content: コンテンツ
+            content: コンテンツ（HTML文字列またはFragment）
+            scripts: bodyの最後に追加するスクリプトタグ（HTML文字列またはFragment。オプション）
         
         Returns:
             str: HTML文字列
         """
-        return f"""<!DOCTYPE html>
-<html lang="ja">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta http-equiv="Content-Security-Policy" content="default-src 'self'; script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.plot.ly; style-src 'self' 'unsafe-inline' https://fonts.googleapis.com; font-src 'self' https://fonts.gstatic.com; img-src 'self' data: https:; connect-src 'self' https://api.github.com;">
-    <title>{title}</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&family=Noto+Sans+JP:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="../assets/css/main.css">
-    <script type="text/javascript">window.PlotlyConfig = {{MathJaxConfig: 'local'}};</script>
-    <script charset="utf-8" src="https://cdn.plot.ly/plotly-2.26.0.min.js"></script>
-</head>
-<body>
-    <div class="container">
-        <!-- Skeleton UI -->
-        <div id="skeleton" class="skeleton hidden">
-            <div class="skel-card"></div>
-            <div class="skel-card"></div>
-            <div class="skel-card"></div>
-        </div>
-        {content}
-    </div>
-    <script src="../assets/js/main.js"></script>
-</body>
-</html>"""
+        return Markup("".join(Layout.iter_base_html(title, content, scripts)))
+    
+    @staticmethod
+    def iter_base_html(title: str, content: str, scripts: str = "") -> Iterator[str]:
+        """
+        ベースHTMLを断片ごとに生成（ファイルへ逐次書き込む場合に使用）
+        
+        Args:
+            title: ページタイトル
+            content: コンテンツ（HTML文字列またはFragment）
+            scripts: bodyの最後に追加するスクリプトタグ（HTML文字列またはFragment。オプション）
+        
+        Yields:
+            str: HTML断片
+        """
+        return get_template("page.html").iter_render({
+            "title": title,
+            "content": _as_markup(content),
+            "scripts": _as_markup(scripts),
+        })
+    
+    @staticmethod
+    def iter_base_bytes(title: str, content: str, scripts: str = "") -> Iterator[bytes]:
+        """
+        ベースHTMLをUTF-8バイト列の断片ごとに生成（バイナリモードのファイルへ逐次書き込む場合に使用）
+        
+        Args:
+            title: ページタイトル
+            content: コンテンツ（HTML文字列またはFragment）
+            scripts: bodyの最後に追加するスクリプトタグ（HTML文字列またはFragment。オプション）
+        
+        Yields:
+            bytes: HTML断片
+        """
+        return get_template("page.html").iter_render_bytes({
+            "title": title,
+            "content": _as_markup(content),
+            "scripts": _as_markup(scripts),
+        })
     
     @staticmethod
-    def get_header(market_name: str, timeframe_name: str, market_code: str, timeframe_code: str) -> str:
+    def get_header(market_name: str, timeframe_name: str, market_code: str, timeframe_code: str,
+                   generated_at: Optional[str] = None) -> str:
         """
         ヘッダーを生成（市場・期間選択UIを含む）
         
@@ -57,26 +199,48 @@ class Layout:
             timeframe_name: 期間名
             market_code: 市場コード（"US" or "JP"）
             timeframe_code: 期間コード（"short", "medium", "long"）
+            generated_at: 生成日時（省略時は後から置換するためのマーカーを出力）
         
         Returns:
             str: HTML文字列
         """
-        market_selector = Layout.get_market_selector(market_code)
-        timeframe_selector = Layout.get_timeframe_selector(timeframe_code)
+        if generated_at is None:
+            report_timestamp = REPORT_TIMESTAMP_MARKER
+        else:
+            report_timestamp = f'<div class="report-generated">Generated at: {escape(generated_at)}</div>'
+        
+        prefix, suffix = Layout._get_header_parts(market_name, timeframe_name, market_code, timeframe_code)
+        return Markup(prefix + report_timestamp + suffix)
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _get_header_parts(market_name: str, timeframe_name: str, market_code: str,
+                          timeframe_code: str) -> Tuple[str, str]:
+        """
+        ヘッダーの生成日時より前・後の固定部分を生成（市場・期間ごとに1回だけ組み立てる）
+        
+        Args:
+            market_name: 市場名
+            timeframe_name: 期間名
+            market_code: 市場コード（"US" or "JP"）
+            timeframe_code: 期間コード（"short", "medium", "long"）
         
-        return f"""<header>
-            <h1>{market_name} - {timeframe_name}市場レポート</h1>
-            <p class="subtitle">実データに基づく市場分析（判断材料の提供のみ）</p>
-            <!--REPORT_TIMESTAMP-->
-            {market_selector}
-            {timeframe_selector}
-            <!-- 市場ヒートマップ -->
-            <div id="market-heatmap" class="heatmap-grid"></div>
-        </header>"""
+        Returns:
+            Tuple[str, str]: (生成日時より前, 生成日時より後)
+        """
+        html = get_template("header.html").render({
+            "market_name": market_name,
+            "timeframe_name": timeframe_name,
+            "report_timestamp": Markup(REPORT_TIMESTAMP_MARKER),
+            "market_selector": Markup(Layout.get_market_selector(market_code)),
+            "timeframe_selector": Markup(Layout.get_timeframe_selector(timeframe_code)),
+        })
+        prefix, _, suffix = html.partition(REPORT_TIMESTAMP_MARKER)
+        return prefix, suffix
     
     @staticmethod
     def get_section(title: str, chart_html: str, interpretation: str, 
-                   period_selector: str = "") -> str:
+                   period_selector: str = "", block: str = "") -> str:
         """
         セクションを生成（カード形式、常時表示）
         
@@ -85,39 +249,35 @@ class Layout:
             chart_html: チャートHTML
             interpretation: 解釈文章（Fact箇条書き）
             period_selector: 期間選択UI（オプション）
+            block: ブロッククラス（"block-1" など。オプション）
         
         Returns:
             str: HTML文字列
         """
         # チャートタイプを判定（タイトルから）
-        chart_type = ""
-        if "株価指数" in title or "①" in title:
-            chart_type = "price"
-        elif "政策金利" in title or "長期金利" in title or "②" in title:
-            chart_type = "rate"
-        elif "CPI" in title or "③" in title:
-            chart_type = "cpi"
-        elif "EPS" in title or "PER" in title or "④" in title:
-            chart_type = "eps_per"
-        
-        chart_container_attr = f' data-chart-type="{chart_type}"' if chart_type else ""
+        chart_type = _chart_type_for_title(title)
+        
+        chart_container_attr = _CHART_CONTAINER_ATTRS[chart_type]
         
         # チャートがない場合はチャート部分を省略
         chart_section = ""
-        if chart_html and chart_html.strip() and chart_html != "<p>この指標は現在データを取得できません</p>":
-            chart_section = f"""
-            {period_selector}
-            <div class="chart-container"{chart_container_attr}>
-                {chart_html}
-            </div>"""
-        
-        return f"""<section class="card">
-            <h2 class="section-title">{title}</h2>
-            {chart_section}
-            <div class="interpretation">
-                {interpretation}
-            </div>
-        </section>"""
+        if chart_html and chart_html.strip() and chart_html != NO_DATA_HTML:
+            chart_section = get_template("section_chart.html").render({
+                "period_selector": Markup(period_selector),
+                "chart_container_attr": chart_container_attr,
+                "chart_html": Markup(chart_html),
+            })
+        
+        section_class = _SECTION_CLASSES.get(block)
+        if section_class is None:
+            section_class = f"card {block}"
+        
+        return get_template("section.html").render({
+            "section_class": section_class,
+            "title": Markup(title),
+            "chart_section": chart_section,
+            "interpretation": Markup(interpretation),
+        })
     
     @staticmethod
     def get_period_selector(years: int, switchable_years: list, chart_id: str) -> str:
@@ -135,16 +295,7 @@ class Layout:
         if not switchable_years:
             return ""
         
-        buttons = []
-        all_years = sorted(set([years] + switchable_years))
-        
-        for y in all_years:
-            active_class = "active" if y == years else ""
-            buttons.append(
-                f'<button class="period-btn {active_class}" data-years="{y}" data-chart-id="{chart_id}">{y}年</button>'
-            )
-        
-        return f'<div class="period-selector">{"".join(buttons)}</div>'
+        return _build_period_selector(years, tuple(switchable_years), chart_id)
     
     @staticmethod
     def get_market_selector(current_market: str) -> str:
@@ -157,19 +308,10 @@ class Layout:
         Returns:
             str: HTML文字列
         """
-        markets = [
-            ("US", "米国"),
-            ("JP", "日本")
-        ]
-        
-        buttons = []
-        for market_code, market_name in markets:
-            active_class = "active" if market_code == current_market else ""
-            buttons.append(
-                f'<button class="market-btn {active_class}" data-market="{market_code}">{market_name}</button>'
-            )
-        
-        return f'<div class="market-selector">{"".join(buttons)}</div>'
+        html = _MARKET_SELECTOR_HTML.get(current_market)
+        if html is None:
+            html = _build_selector(MARKETS, "market", current_market)
+        return html
     
     @staticmethod
     def get_timeframe_selector(current_timeframe: str) -> str:
@@ -182,20 +324,10 @@ class Layout:
         Returns:
             str: HTML文字列
         """
-        timeframes = [
-            ("short", "短期"),
-            ("medium", "中期"),
-            ("long", "長期")
-        ]
-        
-        buttons = []
-        for timeframe_code, timeframe_name in timeframes:
-            active_class = "active" if timeframe_code == current_timeframe else ""
-            buttons.append(
-                f'<button class="timeframe-btn {active_class}" data-timeframe="{timeframe_code}">{timeframe_name}</button>'
-            )
-        
-        return f'<div class="timeframe-selector">{"".join(buttons)}</div>'
+        html = _TIMEFRAME_SELECTOR_HTML.get(current_timeframe)
+        if html is None:
+            html = _build_selector(TIMEFRAMES, "timeframe", current_timeframe)
+        return html
     
     @staticmethod
     def get_rank_cards(rank_data: list) -> str:
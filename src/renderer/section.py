@@ -1,151 +1,162 @@
 """
 セクション生成
 """
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+import numpy as np
+from .layout import Layout, NO_DATA_HTML
+
+
+# Fact項目の定義
+# 項目ID → (Factキー, カラム, 指標名, 現在値の単位, 中期差分の比較対象（末尾から何件目か）, 差分を%ポイントで表示するか)
+# 指標名がNoneの項目は市場コードから決める
+_FACT_ITEMS = {
+    "price": ("price", "Close", None, "", 126, False),  # 約6ヶ月分（営業日ベース）
+    "policy_rate": ("policy_rate", "policy_rate", "政策金利", "%", 6, False),  # 月次データなので6ヶ月
+    "long_rate": ("long_rate", "long_rate_10y", "長期金利（10年）", "%", 6, False),
+    "cpi": ("cpi", "CPI_YoY", "CPI前年比", "%", 6, True),  # CPI YoYは既に%なので差分は%ポイント
+    "eps": ("eps_per", "EPS", "EPS", "", 2, False),  # 四半期データなので2四半期
+    "per": ("eps_per", "PER", "PER", "", 2, False),
+}
+
+# 方向矢印（直近値 - 前回値の符号 → 矢印HTML）
+_ARROW_HTML_BY_SIGN = {
+    1: '<span class="econ-arrow up">▲</span>',
+    -1: '<span class="econ-arrow down">▼</span>',
+    0: '<span class="econ-arrow flat">■</span>',
+}
+
+# セクションごとのFact項目
+_SECTION_FACT_ITEMS = {
+    "price": ("price",),
+    "rate": ("policy_rate", "long_rate"),
+    "cpi": ("cpi",),
+    "eps_per": ("eps", "per"),
+}
+
+# 欠損除去済みの値のキャッシュ（(DataFrameのid, カラム) → (DataFrame, 値)）
+# 同じDataFrameを複数のセクション・ページで使う場合に取り出し直さない
+_VALID_VALUES_CACHE: "OrderedDict[Tuple[int, str], Tuple[Any, np.ndarray]]" = OrderedDict()
+VALID_VALUES_CACHE_SIZE = 64
 
 
 class SectionRenderer:
     """セクションをレンダリングするクラス"""
     
     @staticmethod
-    def _get_price_fact_list(page_data: Dict[str, Any]) -> str:
-        """株価指数のfact-listを生成"""
-        facts = page_data.get("facts", {})
-        price_fact = facts.get("price")
-        if price_fact and price_fact.get("is_valid"):
-            price_data = price_fact.get("data")
-            if price_data is not None and not price_data.empty and "Close" in price_data.columns:
-                values = price_data["Close"].dropna()
-                if len(values) >= 2:
-                    current = float(values.iloc[-1])
-                    previous = float(values.iloc[-2])
-                    prev_diff_pct = ((current - previous) / previous) * 100 if previous != 0 else 0
-                    mid_diff_pct = None
-                    if len(values) >= 126:
-                        mid_value = float(values.iloc[-126])
-                        mid_diff_pct = ((current - mid_value) / mid_value) * 100 if mid_value != 0 else 0
-                    
-                    indicator_name = "S&P500" if page_data.get("market_code") == "US" else "日経平均"
-                    prev_str = f" | 前期比 {prev_diff_pct:+.2f}%"
-                    mid_str = f" | 中期差分 {mid_diff_pct:+.2f}%" if mid_diff_pct is not None else ""
-                    item = f"{indicator_name}：{current:.2f}{prev_str}{mid_str}"
-                    return f'<ul class="fact-list">\n<li>{item}</li>\n</ul>'
-        return '<ul class="fact-list"><li>データが取得できません。</li></ul>'
+    def _valid_values(page_data: Dict[str, Any], fact_key: str, column_name: str) -> Optional[np.ndarray]:
+        """
+        Factデータから指定カラムの欠損を除いた値を取り出す
+        
+        fact-listと方向矢印で同じ値を使うため、セクションごとに1回だけ呼び出す。
+        同じDataFrameからの取り出し結果はキャッシュする（返り値は書き換え不可）
+        
+        Args:
+            page_data: ページデータ
+            fact_key: Factのキー（"price", "policy_rate" など）
+            column_name: カラム名
+        
+        Returns:
+            Optional[np.ndarray]: 値の配列（Factが無効な場合はNone）
+        """
+        fact = page_data.get("facts", {}).get(fact_key)
+        if not fact or not fact.get("is_valid"):
+            return None
+        
+        data = fact.get("data")
+        if data is None or data.empty or column_name not in data.columns:
+            return None
+        
+        cache_key = (id(data), column_name)
+        cached = _VALID_VALUES_CACHE.get(cache_key)
+        # 元のDataFrameを保持しているので、同じidなら同じオブジェクト
+        if cached is not None and cached[0] is data:
+            _VALID_VALUES_CACHE.move_to_end(cache_key)
+            return cached[1]
+        
+        values = data[column_name].to_numpy(dtype="float64", na_value=np.nan)
+        values = values[~np.isnan(values)]
+        # キャッシュと共有するため書き換え不可にする
+        values.flags.writeable = False
+        _VALID_VALUES_CACHE[cache_key] = (data, values)
+        if len(_VALID_VALUES_CACHE) > VALID_VALUES_CACHE_SIZE:
+            _VALID_VALUES_CACHE.popitem(last=False)
+        return values
     
     @staticmethod
-    def _get_rate_fact_list(page_data: Dict[str, Any]) -> str:
-        """政策金利・長期金利のfact-listを生成"""
-        facts = page_data.get("facts", {})
-        fact_items = []
+    def _format_fact_item(label: str, unit: str, values: Optional[np.ndarray],
+                          mid_offset: int, as_point: bool) -> Optional[str]:
+        """
+        Fact項目を1行分生成（指標名：現在値 | 前期比 ±X.XX | 中期差分 ±X.XX の形式）
+        
+        Args:
+            label: 指標名
+            unit: 現在値の単位（"%" など）
+            values: 欠損除去済みの値
+            mid_offset: 中期差分の比較対象（末尾から何件目か）
+            as_point: Trueなら差分を%ポイント、Falseなら変化率で表示
         
-        # 政策金利
-        policy_fact = facts.get("policy_rate")
-        if policy_fact and policy_fact.get("is_valid"):
-            policy_data = policy_fact.get("data")
-            if policy_data is not None and not policy_data.empty and "policy_rate" in policy_data.columns:
-                values = policy_data["policy_rate"].dropna()
-                if len(values) >= 2:
-                    current = float(values.iloc[-1])
-                    previous = float(values.iloc[-2])
-                    prev_diff_pct = ((current - previous) / previous) * 100 if previous != 0 else 0
-                    mid_diff_pct = None
-                    if len(values) >= 6:
-                        mid_value = float(values.iloc[-6])
-                        mid_diff_pct = ((current - mid_value) / mid_value) * 100 if mid_value != 0 else 0
-                    
-                    prev_str = f" | 前期比 {prev_diff_pct:+.2f}%"
-                    mid_str = f" | 中期差分 {mid_diff_pct:+.2f}%" if mid_diff_pct is not None else ""
-                    fact_items.append(f"政策金利：{current:.2f}%{prev_str}{mid_str}")
-        
-        # 長期金利
-        long_rate_fact = facts.get("long_rate")
-        if long_rate_fact and long_rate_fact.get("is_valid"):
-            long_rate_data = long_rate_fact.get("data")
-            if long_rate_data is not None and not long_rate_data.empty and "long_rate_10y" in long_rate_data.columns:
-                values = long_rate_data["long_rate_10y"].dropna()
-                if len(values) >= 2:
-                    current = float(values.iloc[-1])
-                    previous = float(values.iloc[-2])
-                    prev_diff_pct = ((current - previous) / previous) * 100 if previous != 0 else 0
-                    mid_diff_pct = None
-                    if len(values) >= 6:
-                        mid_value = float(values.iloc[-6])
-                        mid_diff_pct = ((current - mid_value) / mid_value) * 100 if mid_value != 0 else 0
-                    
-                    prev_str = f" | 前期比 {prev_diff_pct:+.2f}%"
-                    mid_str = f" | 中期差分 {mid_diff_pct:+.2f}%" if mid_diff_pct is not None else ""
-                    fact_items.append(f"長期金利（10年）：{current:.2f}%{prev_str}{mid_str}")
+        Returns:
+            Optional[str]: Fact項目（値が2件未満の場合はNone）
+        """
+        if values is None or len(values) < 2:
+            return None
         
-        if fact_items:
-            list_items = "\n".join([f"<li>{item}</li>" for item in fact_items])
-            return f'<ul class="fact-list">\n{list_items}\n</ul>'
-        return '<ul class="fact-list"><li>データが取得できません。</li></ul>'
+        current = float(values[-1])
+        previous = float(values[-2])
+        mid_value = float(values[-mid_offset]) if len(values) >= mid_offset else None
+        
+        if as_point:
+            prev_str = f" | 前期比 {current - previous:+.2f}%ポイント"
+            mid_str = f" | 中期差分 {current - mid_value:+.2f}%ポイント" if mid_value is not None else ""
+        else:
+            prev_diff_pct = ((current - previous) / previous) * 100 if previous != 0 else 0
+            prev_str = f" | 前期比 {prev_diff_pct:+.2f}%"
+            mid_str = ""
+            if mid_value is not None:
+                mid_diff_pct = ((current - mid_value) / mid_value) * 100 if mid_value != 0 else 0
+                mid_str = f" | 中期差分 {mid_diff_pct:+.2f}%"
+        
+        return f"{label}：{current:.2f}{unit}{prev_str}{mid_str}"
     
     @staticmethod
-    def _get_cpi_fact_list(page_data: Dict[str, Any]) -> str:
-        """CPIのfact-listを生成"""
-        facts = page_data.get("facts", {})
-        cpi_fact = facts.get("cpi")
-        if cpi_fact and cpi_fact.get("is_valid"):
-            cpi_data = cpi_fact.get("data")
-            if cpi_data is not None and not cpi_data.empty and "CPI_YoY" in cpi_data.columns:
-                values = cpi_data["CPI_YoY"].dropna()
-                if len(values) >= 2:
-                    current = float(values.iloc[-1])
-                    previous = float(values.iloc[-2])
-                    prev_diff_pp = current - previous
-                    mid_diff_pp = None
-                    if len(values) >= 6:
-                        mid_value = float(values.iloc[-6])
-                        mid_diff_pp = current - mid_value
-                    
-                    prev_str = f" | 前期比 {prev_diff_pp:+.2f}%ポイント"
-                    mid_str = f" | 中期差分 {mid_diff_pp:+.2f}%ポイント" if mid_diff_pp is not None else ""
-                    item = f"CPI前年比：{current:.2f}%{prev_str}{mid_str}"
-                    return f'<ul class="fact-list">\n<li>{item}</li>\n</ul>'
-        return '<ul class="fact-list"><li>データが取得できません。</li></ul>'
+    def _get_fact_values(page_data: Dict[str, Any], item_ids: Tuple[str, ...]) -> Dict[str, Optional[np.ndarray]]:
+        """
+        Fact項目ごとの値を取り出す
+        
+        Args:
+            page_data: ページデータ
+            item_ids: Fact項目IDのタプル
+        
+        Returns:
+            Dict[str, Optional[np.ndarray]]: 項目ID → 欠損除去済みの値
+        """
+        return {
+            item_id: SectionRenderer._valid_values(page_data, _FACT_ITEMS[item_id][0], _FACT_ITEMS[item_id][1])
+            for item_id in item_ids
+        }
     
     @staticmethod
-    def _get_eps_per_fact_list(page_data: Dict[str, Any]) -> str:
-        """EPS+PERのfact-listを生成"""
-        facts = page_data.get("facts", {})
-        eps_per_fact = facts.get("eps_per")
-        fact_items = []
+    def _build_fact_list(page_data: Dict[str, Any], values: Dict[str, Optional[np.ndarray]]) -> str:
+        """
+        fact-listを生成
         
-        if eps_per_fact and eps_per_fact.get("is_valid"):
-            eps_per_data = eps_per_fact.get("data")
-            if eps_per_data is not None and not eps_per_data.empty:
-                # EPS
-                if "EPS" in eps_per_data.columns:
-                    eps_values = eps_per_data["EPS"].dropna()
-                    if len(eps_values) >= 2:
-                        current = float(eps_values.iloc[-1])
-                        previous = float(eps_values.iloc[-2])
-                        prev_diff_pct = ((current - previous) / previous) * 100 if previous != 0 else 0
-                        mid_diff_pct = None
-                        if len(eps_values) >= 2:
-                            mid_value = float(eps_values.iloc[-2])
-                            mid_diff_pct = ((current - mid_value) / mid_value) * 100 if mid_value != 0 else 0
-                        
-                        prev_str = f" | 前期比 {prev_diff_pct:+.2f}%"
-                        mid_str = f" | 中期差分 {mid_diff_pct:+.2f}%" if mid_diff_pct is not None else ""
-                        fact_items.append(f"EPS：{current:.2f}{prev_str}{mid_str}")
-                
-                # PER
-                if "PER" in eps_per_data.columns:
-                    per_values = eps_per_data["PER"].dropna()
-                    if len(per_values) >= 2:
-                        current = float(per_values.iloc[-1])
-                        previous = float(per_values.iloc[-2])
-                        prev_diff_pct = ((current - previous) / previous) * 100 if previous != 0 else 0
-                        mid_diff_pct = None
-                        if len(per_values) >= 2:
-                            mid_value = float(per_values.iloc[-2])
-                            mid_diff_pct = ((current - mid_value) / mid_value) * 100 if mid_value != 0 else 0
-                        
-                        prev_str = f" | 前期比 {prev_diff_pct:+.2f}%"
-                        mid_str = f" | 中期差分 {mid_diff_pct:+.2f}%" if mid_diff_pct is not None else ""
-                        fact_items.append(f"PER：{current:.2f}{prev_str}{mid_str}")
+        Args:
+            page_data: ページデータ
+            values: 項目ID → 欠損除去済みの値（この順で出力）
+        
+        Returns:
+            str: 箇条書きHTML
+        """
+        fact_items = []
+        for item_id, item_values in values.items():
+            _, _, label, unit, mid_offset, as_point = _FACT_ITEMS[item_id]
+            if label is None:
+                # 株価指数は市場によって指標名が異なる
+                label = "S&P500" if page_data.get("market_code") == "US" else "日経平均"
+            item = SectionRenderer._format_fact_item(label, unit, item_values, mid_offset, as_point)
+            if item is not None:
+                fact_items.append(item)
         
         if fact_items:
             list_items = "\n".join([f"<li>{item}</li>" for item in fact_items])
@@ -153,130 +164,116 @@ class SectionRenderer:
         return '<ul class="fact-list"><li>データが取得できません。</li></ul>'
     
     @staticmethod
-    def render_price_section(page_data: Dict[str, Any]) -> str:
-        """株価指数セクションをレンダリング"""
-        chart_html = page_data.get("charts", {}).get("price", "<p>この指標は現在データを取得できません</p>")
+    def _render_card(page_data: Dict[str, Any], title: str, interpretation: str, block: str,
+                     chart_key: str = "", chart_id: str = "") -> str:
+        """
+        カード形式のセクションを生成（各render_*_sectionの共通部分）
         
-        # Factを新しいフォーマットで生成
-        interpretation = SectionRenderer._get_price_fact_list(page_data)
+        Args:
+            page_data: ページデータ
+            title: セクションタイトル
+            interpretation: 解釈文章（Fact箇条書き）
+            block: ブロッククラス（"block-1" など）
+            chart_key: page_data["charts"] のキー（チャートなしの場合は空文字）
+            chart_id: チャートID（期間選択UIを出さない場合は空文字）
         
-        # 経済指標方向矢印を追加
-        price_data = page_data.get("facts", {}).get("price")
-        arrow_html = ""
-        if price_data and price_data.get("is_valid"):
-            arrow_html = SectionRenderer._get_direction_arrow(price_data, "Close")
+        Returns:
+            str: HTML文字列
+        """
+        chart_html = ""
+        if chart_key:
+            chart_html = page_data.get("charts", {}).get(chart_key, NO_DATA_HTML)
         
-        years = page_data.get("years", 1)
-        switchable_years = page_data.get("switchable_years", [])
         period_selector = ""
+        if chart_id:
+            switchable_years = page_data.get("switchable_years", [])
+            if switchable_years:
+                years = page_data.get("years", 1)
+                period_selector = Layout.get_period_selector(years, switchable_years, chart_id)
         
-        if switchable_years:
-            from .layout import Layout
-            period_selector = Layout.get_period_selector(years, switchable_years, "price-chart")
-        
-        from .layout import Layout
-        title = f"① 株価指数チャート{arrow_html}"
-        section_html = Layout.get_section(
-            title,
-            chart_html,
-            interpretation,
-            period_selector
+        return Layout.get_section(title, chart_html, interpretation, period_selector, block)
+    
+    @staticmethod
+    def render_price_section(page_data: Dict[str, Any], close_values: Optional[np.ndarray] = None) -> str:
+        """
+        株価指数セクションをレンダリング
+        
+        Args:
+            page_data: ページデータ
+            close_values: 欠損除去済みの終値（ヒートマップと共用する場合に渡す。省略時はここで取り出す）
+        
+        Returns:
+            str: HTML文字列
+        """
+        # 終値はfact-listと方向矢印で共用する
+        if close_values is None:
+            values = SectionRenderer._get_fact_values(page_data, _SECTION_FACT_ITEMS["price"])
+        else:
+            values = {"price": close_values}
+        
+        # Factを新しいフォーマットで生成
+        interpretation = SectionRenderer._build_fact_list(page_data, values)
+        
+        # 経済指標方向矢印を追加
+        arrow_html = SectionRenderer._arrow_from_values(values["price"])
+        
+        # block-1（全幅表示）
+        return SectionRenderer._render_card(
+            page_data, f"① 株価指数チャート{arrow_html}", interpretation, "block-1", "price", "price-chart"
         )
-        # block-1クラスを追加（全幅表示）
-        return section_html.replace('<section class="card">', '<section class="card block-1">')
     
     @staticmethod
     def render_rate_section(page_data: Dict[str, Any]) -> str:
         """政策金利・長期金利セクションをレンダリング"""
-        chart_html = page_data.get("charts", {}).get("rate", "<p>この指標は現在データを取得できません</p>")
+        values = SectionRenderer._get_fact_values(page_data, _SECTION_FACT_ITEMS["rate"])
         
         # Factを新しいフォーマットで生成
-        interpretation = SectionRenderer._get_rate_fact_list(page_data)
+        interpretation = SectionRenderer._build_fact_list(page_data, values)
         
         # 経済指標方向矢印を追加（政策金利と長期金利の両方）
-        policy_data = page_data.get("facts", {}).get("policy_rate")
-        long_rate_data = page_data.get("facts", {}).get("long_rate")
+        facts = page_data.get("facts", {})
+        policy_data = facts.get("policy_rate")
+        long_rate_data = facts.get("long_rate")
         
         arrows = []
         if policy_data and policy_data.get("is_valid"):
-            arrow = SectionRenderer._get_direction_arrow(policy_data, "policy_rate")
+            arrow = SectionRenderer._arrow_from_values(values["policy_rate"])
             arrows.append(f"政策金利{arrow}")
         if long_rate_data and long_rate_data.get("is_valid"):
-            arrow = SectionRenderer._get_direction_arrow(long_rate_data, "long_rate_10y")
+            arrow = SectionRenderer._arrow_from_values(values["long_rate"])
             arrows.append(f"長期金利{arrow}")
         
         title = "② 政策金利 + 長期金利（10年）"
         if arrows:
             title = f"② 政策金利 + 長期金利（10年） - {' / '.join(arrows)}"
         
-        years = page_data.get("years", 1)
-        switchable_years = page_data.get("switchable_years", [])
-        period_selector = ""
-        
-        if switchable_years:
-            from .layout import Layout
-            period_selector = Layout.get_period_selector(years, switchable_years, "rate-chart")
-        
-        from .layout import Layout
-        section_html = Layout.get_section(
-            title,
-            chart_html,
-            interpretation,
-            period_selector
-        )
-        # block-2クラスを追加
-        return section_html.replace('<section class="card">', '<section class="card block-2">')
+        return SectionRenderer._render_card(page_data, title, interpretation, "block-2", "rate", "rate-chart")
     
     @staticmethod
     def render_cpi_section(page_data: Dict[str, Any]) -> str:
         """CPIセクションをレンダリング"""
-        chart_html = page_data.get("charts", {}).get("cpi", "<p>この指標は現在データを取得できません</p>")
+        values = SectionRenderer._get_fact_values(page_data, _SECTION_FACT_ITEMS["cpi"])
         
         # Factを新しいフォーマットで生成
-        interpretation = SectionRenderer._get_cpi_fact_list(page_data)
+        interpretation = SectionRenderer._build_fact_list(page_data, values)
         
         # 経済指標方向矢印を追加
-        cpi_data = page_data.get("facts", {}).get("cpi")
-        arrow_html = ""
-        if cpi_data and cpi_data.get("is_valid"):
-            arrow_html = SectionRenderer._get_direction_arrow(cpi_data, "CPI_YoY")
-        
-        years = page_data.get("years", 1)
-        switchable_years = page_data.get("switchable_years", [])
-        period_selector = ""
+        arrow_html = SectionRenderer._arrow_from_values(values["cpi"])
         
-        if switchable_years:
-            from .layout import Layout
-            period_selector = Layout.get_period_selector(years, switchable_years, "cpi-chart")
-        
-        from .layout import Layout
-        title = f"③ CPI（消費者物価指数）前年比{arrow_html}"
-        section_html = Layout.get_section(
-            title,
-            chart_html,
-            interpretation,
-            period_selector
+        return SectionRenderer._render_card(
+            page_data, f"③ CPI（消費者物価指数）前年比{arrow_html}", interpretation, "block-3", "cpi", "cpi-chart"
         )
-        # block-3クラスを追加
-        return section_html.replace('<section class="card">', '<section class="card block-3">')
     
     @staticmethod
     def render_eps_per_section(page_data: Dict[str, Any]) -> str:
         """EPS + PERセクションをレンダリング"""
-        chart_html = page_data.get("charts", {}).get("eps_per", "<p>この指標は現在データを取得できません</p>")
-        
         # Factを新しいフォーマットで生成
-        interpretation = SectionRenderer._get_eps_per_fact_list(page_data)
-        
-        from .layout import Layout
-        section_html = Layout.get_section(
-            "④ EPS + PER（20年固定）",
-            chart_html,
-            interpretation,
-            ""
+        interpretation = SectionRenderer._build_fact_list(
+            page_data, SectionRenderer._get_fact_values(page_data, _SECTION_FACT_ITEMS["eps_per"])
         )
-        # block-4クラスを追加
-        return section_html.replace('<section class="card">', '<section class="card block-4">')
+        
+        # 20年固定のため期間選択UIなし
+        return SectionRenderer._render_card(page_data, "④ EPS + PER（20年固定）", interpretation, "block-4", "eps_per")
     
     @staticmethod
     def _format_fact_list(text: str) -> str:
@@ -293,25 +290,13 @@ class SectionRenderer:
             return text
         
         # 文章を文単位で分割（句点で区切る）
-        sentences = [s.strip() for s in text.split('。') if s.strip()]
+        sentences = [s for s in map(str.strip, text.split('。')) if s]
         
         if not sentences:
             return text
         
-        # 最後の文が空でない場合は句点を追加
-        formatted_sentences = []
-        for i, sentence in enumerate(sentences):
-            if i < len(sentences) - 1:
-                formatted_sentences.append(sentence + '。')
-            else:
-                # 最後の文は句点があればそのまま、なければ追加
-                if not sentence.endswith('。'):
-                    formatted_sentences.append(sentence + '。')
-                else:
-                    formatted_sentences.append(sentence)
-        
-        # 箇条書きHTMLに変換
-        list_items = "\n".join([f"<li>{s}</li>" for s in formatted_sentences])
+        # 箇条書きHTMLに変換（句点で区切っているため各文の末尾に句点はない。すべての文に句点を付け直す）
+        list_items = "\n".join([f"<li>{s}。</li>" for s in sentences])
         return f'<ul class="fact-list">\n{list_items}\n</ul>'
     
     @staticmethod
@@ -325,263 +310,55 @@ class SectionRenderer:
         Returns:
             str: 箇条書きHTML
         """
-        import pandas as pd
-        
-        facts = page_data.get("facts", {})
-        fact_items = []
-        
-        # 株価指数のFact
-        price_fact = facts.get("price")
-        if price_fact and price_fact.get("is_valid"):
-            price_data = price_fact.get("data")
-            if price_data is not None and not price_data.empty and "Close" in price_data.columns:
-                values = price_data["Close"].dropna()
-                if len(values) >= 2:
-                    current = float(values.iloc[-1])
-                    previous = float(values.iloc[-2])
-                    # 前期比（前回値との差分）
-                    prev_diff = current - previous
-                    prev_diff_pct = (prev_diff / previous) * 100 if previous != 0 else 0
-                    # 中期差分（6ヶ月前との差分、データが十分にある場合）
-                    mid_diff = None
-                    mid_diff_pct = None
-                    if len(values) >= 126:  # 約6ヶ月分のデータ（営業日ベース）
-                        mid_value = float(values.iloc[-126])
-                        mid_diff = current - mid_value
-                        mid_diff_pct = (mid_diff / mid_value) * 100 if mid_value != 0 else 0
-                    
-                    indicator_name = "S&P500" if page_data.get("market_code") == "US" else "日経平均"
-                    prev_str = f" | 前期比 {prev_diff_pct:+.2f}%"
-                    mid_str = f" | 中期差分 {mid_diff_pct:+.2f}%" if mid_diff_pct is not None else ""
-                    fact_items.append(f"{indicator_name}：{current:.2f}{prev_str}{mid_str}")
-        
-        # 政策金利のFact
-        policy_fact = facts.get("policy_rate")
-        if policy_fact and policy_fact.get("is_valid"):
-            policy_data = policy_fact.get("data")
-            if policy_data is not None and not policy_data.empty and "policy_rate" in policy_data.columns:
-                values = policy_data["policy_rate"].dropna()
-                if len(values) >= 2:
-                    current = float(values.iloc[-1])
-                    previous = float(values.iloc[-2])
-                    prev_diff = current - previous
-                    prev_diff_pct = (prev_diff / previous) * 100 if previous != 0 else 0
-                    # 中期差分（6ヶ月前との差分）
-                    mid_diff_pct = None
-                    if len(values) >= 6:  # 月次データなので6ヶ月
-                        mid_value = float(values.iloc[-6])
-                        mid_diff = current - mid_value
-                        mid_diff_pct = (mid_diff / mid_value) * 100 if mid_value != 0 else 0
-                    
-                    prev_str = f" | 前期比 {prev_diff_pct:+.2f}%"
-                    mid_str = f" | 中期差分 {mid_diff_pct:+.2f}%" if mid_diff_pct is not None else ""
-                    fact_items.append(f"政策金利：{current:.2f}%{prev_str}{mid_str}")
-        
-        # 長期金利のFact
-        long_rate_fact = facts.get("long_rate")
-        if long_rate_fact and long_rate_fact.get("is_valid"):
-            long_rate_data = long_rate_fact.get("data")
-            if long_rate_data is not None and not long_rate_data.empty and "long_rate_10y" in long_rate_data.columns:
-                values = long_rate_data["long_rate_10y"].dropna()
-                if len(values) >= 2:
-                    current = float(values.iloc[-1])
-                    previous = float(values.iloc[-2])
-                    prev_diff = current - previous
-                    prev_diff_pct = (prev_diff / previous) * 100 if previous != 0 else 0
-                    # 中期差分（6ヶ月前との差分）
-                    mid_diff_pct = None
-                    if len(values) >= 6:  # 月次データなので6ヶ月
-                        mid_value = float(values.iloc[-6])
-                        mid_diff = current - mid_value
-                        mid_diff_pct = (mid_diff / mid_value) * 100 if mid_value != 0 else 0
-                    
-                    prev_str = f" | 前期比 {prev_diff_pct:+.2f}%"
-                    mid_str = f" | 中期差分 {mid_diff_pct:+.2f}%" if mid_diff_pct is not None else ""
-                    fact_items.append(f"長期金利（10年）：{current:.2f}%{prev_str}{mid_str}")
-        
-        # CPIのFact
-        cpi_fact = facts.get("cpi")
-        if cpi_fact and cpi_fact.get("is_valid"):
-            cpi_data = cpi_fact.get("data")
-            if cpi_data is not None and not cpi_data.empty and "CPI_YoY" in cpi_data.columns:
-                values = cpi_data["CPI_YoY"].dropna()
-                if len(values) >= 2:
-                    current = float(values.iloc[-1])
-                    previous = float(values.iloc[-2])
-                    # CPI YoYは既に%なので、差分を%ポイントで表示
-                    prev_diff_pp = current - previous
-                    # 中期差分（6ヶ月前との差分）
-                    mid_diff_pp = None
-                    if len(values) >= 6:  # 月次データなので6ヶ月
-                        mid_value = float(values.iloc[-6])
-                        mid_diff_pp = current - mid_value
-                    
-                    prev_str = f" | 前期比 {prev_diff_pp:+.2f}%ポイント"
-                    mid_str = f" | 中期差分 {mid_diff_pp:+.2f}%ポイント" if mid_diff_pp is not None else ""
-                    fact_items.append(f"CPI前年比：{current:.2f}%{prev_str}{mid_str}")
-        
-        # EPS+PERのFact
-        eps_per_fact = facts.get("eps_per")
-        if eps_per_fact and eps_per_fact.get("is_valid"):
-            eps_per_data = eps_per_fact.get("data")
-            if eps_per_data is not None and not eps_per_data.empty:
-                # EPS
-                if "EPS" in eps_per_data.columns:
-                    eps_values = eps_per_data["EPS"].dropna()
-                    if len(eps_values) >= 2:
-                        current = float(eps_values.iloc[-1])
-                        previous = float(eps_values.iloc[-2])
-                        prev_diff = current - previous
-                        prev_diff_pct = (prev_diff / previous) * 100 if previous != 0 else 0
-                        # 中期差分（6ヶ月前との差分、四半期データなので2四半期）
-                        mid_diff_pct = None
-                        if len(eps_values) >= 2:
-                            mid_value = float(eps_values.iloc[-2])
-                            mid_diff = current - mid_value
-                            mid_diff_pct = (mid_diff / mid_value) * 100 if mid_value != 0 else 0
-                        
-                        prev_str = f" | 前期比 {prev_diff_pct:+.2f}%"
-                        mid_str = f" | 中期差分 {mid_diff_pct:+.2f}%" if mid_diff_pct is not None else ""
-                        fact_items.append(f"EPS：{current:.2f}{prev_str}{mid_str}")
-                
-                # PER
-                if "PER" in eps_per_data.columns:
-                    per_values = eps_per_data["PER"].dropna()
-                    if len(per_values) >= 2:
-                        current = float(per_values.iloc[-1])
-                        previous = float(per_values.iloc[-2])
-                        prev_diff = current - previous
-                        prev_diff_pct = (prev_diff / previous) * 100 if previous != 0 else 0
-                        # 中期差分（6ヶ月前との差分、四半期データなので2四半期）
-                        mid_diff_pct = None
-                        if len(per_values) >= 2:
-                            mid_value = float(per_values.iloc[-2])
-                            mid_diff = current - mid_value
-                            mid_diff_pct = (mid_diff / mid_value) * 100 if mid_value != 0 else 0
-                        
-                        prev_str = f" | 前期比 {prev_diff_pct:+.2f}%"
-                        mid_str = f" | 中期差分 {mid_diff_pct:+.2f}%" if mid_diff_pct is not None else ""
-                        fact_items.append(f"PER：{current:.2f}{prev_str}{mid_str}")
-        
-        # 箇条書きHTMLに変換
-        if fact_items:
-            list_items = "\n".join([f"<li>{item}</li>" for item in fact_items])
-            return f'<ul class="fact-list">\n{list_items}\n</ul>'
-        else:
-            return '<ul class="fact-list"><li>データが取得できません。</li></ul>'
+        return SectionRenderer._build_fact_list(
+            page_data, SectionRenderer._get_fact_values(page_data, tuple(_FACT_ITEMS))
+        )
     
     @staticmethod
     def render_fact_section(page_data: Dict[str, Any]) -> str:
         """① 観測事実セクションをレンダリング"""
-        from .layout import Layout
-        
         # Factデータから自動要約を生成（指標名：数値 → 状態語の形式）
         fact_content = SectionRenderer._auto_summarize_facts(page_data)
         
-        section_html = Layout.get_section(
-            "① 観測事実",
-            "",
-            fact_content,
-            ""
-        )
-        return section_html.replace('<section class="card">', '<section class="card block-1">')
+        return SectionRenderer._render_card(page_data, "① 観測事実", fact_content, "block-1")
     
     @staticmethod
     def render_interpretation_section(page_data: Dict[str, Any]) -> str:
         """② 解釈セクションをレンダリング"""
-        from .layout import Layout
-        
-        interpretation_content = "<p>解釈情報は現在準備中です。</p>"
-        
-        section_html = Layout.get_section(
-            "② 解釈",
-            "",
-            interpretation_content,
-            ""
-        )
-        return section_html.replace('<section class="card">', '<section class="card block-2">')
+        return SectionRenderer._render_card(page_data, "② 解釈", "<p>解釈情報は現在準備中です。</p>", "block-2")
     
     @staticmethod
     def render_assumption_section(page_data: Dict[str, Any]) -> str:
         """③ 前提セクションをレンダリング"""
-        from .layout import Layout
-        
-        assumption_content = "<p>前提情報は現在準備中です。</p>"
-        
-        section_html = Layout.get_section(
-            "③ 前提",
-            "",
-            assumption_content,
-            ""
-        )
-        return section_html.replace('<section class="card">', '<section class="card block-3">')
+        return SectionRenderer._render_card(page_data, "③ 前提", "<p>前提情報は現在準備中です。</p>", "block-3")
     
     @staticmethod
     def render_turning_point_section(page_data: Dict[str, Any]) -> str:
         """④ 転換条件セクションをレンダリング"""
-        from .layout import Layout
-        
-        turning_point_content = "<p>転換条件情報は現在準備中です。</p>"
-        
-        section_html = Layout.get_section(
-            "④ 転換条件",
-            "",
-            turning_point_content,
-            ""
-        )
-        return section_html.replace('<section class="card">', '<section class="card block-4">')
+        return SectionRenderer._render_card(page_data, "④ 転換条件", "<p>転換条件情報は現在準備中です。</p>", "block-4")
     
     @staticmethod
     def render_reference_section(page_data: Dict[str, Any]) -> str:
         """⑤ 参考情報セクションをレンダリング"""
-        from .layout import Layout
-        
-        reference_content = "<p>参考情報は現在準備中です。</p>"
-        
-        section_html = Layout.get_section(
-            "⑤ 参考情報",
-            "",
-            reference_content,
-            ""
-        )
-        return section_html.replace('<section class="card">', '<section class="card block-5">')
+        return SectionRenderer._render_card(page_data, "⑤ 参考情報", "<p>参考情報は現在準備中です。</p>", "block-5")
     
     @staticmethod
-    def _get_direction_arrow(fact_data: Dict[str, Any], column_name: str) -> str:
+    def _arrow_from_values(values: Optional[np.ndarray]) -> str:
         """
-        経済指標の方向矢印を生成（直近値 - 前回値の符号のみで判定）
+        欠損除去済みの値から方向矢印を生成
         
         Args:
-            fact_data: Factデータ（dataフィールドにDataFrameを含む）
-            column_name: カラム名
+            values: 値の配列
         
         Returns:
-            str: 矢印HTML
+            str: 矢印HTML（値が2件未満の場合は空文字）
         """
-        import pandas as pd
-        
-        if not fact_data or not fact_data.get("is_valid"):
-            return ""
-        
-        data = fact_data.get("data")
-        if data is None or data.empty or column_name not in data.columns:
-            return ""
-        
-        # 直近値と前回値を取得
-        values = data[column_name].dropna()
-        if len(values) < 2:
+        if values is None or len(values) < 2:
             return ""
         
-        current_value = float(values.iloc[-1])
-        previous_value = float(values.iloc[-2])
+        current_value = float(values[-1])
+        previous_value = float(values[-2])
         
         # 符号のみで判定（しきい値・評価ロジックは禁止）
         diff = current_value - previous_value
-        
-        if diff > 0:
-            return '<span class="econ-arrow up">▲</span>'
-        elif diff < 0:
-            return '<span class="econ-arrow down">▼</span>'
-        else:
-            return '<span class="econ-arrow flat">■</span>'
-
+        return _ARROW_HTML_BY_SIGN[(diff > 0) - (diff < 0)]
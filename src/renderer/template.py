@@ -0,0 +1,174 @@
+"""
+HTMLテンプレート
+テンプレートファイルは初回読み込み時に固定部分と差し込み位置に分解しておき、
+描画時は値を差し込んで結合するだけにする
+"""
+import os
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Tuple
+
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
+
+# 差し込み位置（${name}）
+_PLACEHOLDER_PATTERN = re.compile(r"\$\{(\w+)\}")
+
+# HTMLエスケープ表（1パスで置換する）
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#39;",
+})
+
+
+class Markup(str):
+    """エスケープ済み・生成済みのHTML断片（差し込み時にエスケープしない）"""
+    
+    __slots__ = ()
+
+
+def escape(value: Any) -> Markup:
+    """
+    HTMLエスケープ（Markupはそのまま返す）
+    
+    Args:
+        value: 差し込む値
+    
+    Returns:
+        Markup: エスケープ済みの文字列
+    """
+    if isinstance(value, Markup):
+        return value
+    return Markup(str(value).translate(_HTML_ESCAPE))
+
+
+class Fragment:
+    """
+    差し込み先で展開する子テンプレート（描画結果を1つの文字列に結合せず、親の断片の間にそのまま流す）
+    """
+    
+    __slots__ = ("template", "values")
+    
+    def __init__(self, template: "Template", values: Dict[str, Any]):
+        """
+        初期化
+        
+        Args:
+            template: 子テンプレート
+            values: 子テンプレートに差し込む値
+        """
+        self.template = template
+        self.values = values
+
+
+class Template:
+    """分解済みのHTMLテンプレート"""
+    
+    __slots__ = ("_head", "_slots", "_head_bytes", "_slots_bytes")
+    
+    def __init__(self, source: str):
+        """
+        初期化
+        
+        Args:
+            source: テンプレート文字列
+        """
+        parts = _PLACEHOLDER_PATTERN.split(source)
+        # 偶数番目が固定部分、奇数番目が差し込み名
+        self._head: str = parts[0]
+        self._slots: Tuple[Tuple[str, str], ...] = tuple(zip(parts[1::2], parts[2::2]))
+        # ファイル書き込み用に固定部分をUTF-8エンコード済みで持っておく
+        self._head_bytes: bytes = self._head.encode("utf-8")
+        self._slots_bytes: Tuple[Tuple[str, bytes], ...] = tuple(
+            (name, literal.encode("utf-8")) for name, literal in self._slots
+        )
+    
+    def render(self, values: Dict[str, Any]) -> Markup:
+        """
+        テンプレートに値を差し込む
+        
+        Markup以外の値はHTMLエスケープしてから差し込む（Fragmentは子テンプレートを展開する）
+        
+        Args:
+            values: 差し込み名 → 値
+        
+        Returns:
+            Markup: HTML文字列
+        """
+        chunks = [self._head]
+        append = chunks.append
+        for name, literal in self._slots:
+            value = values[name]
+            if type(value) is Markup:
+                append(value)
+            elif type(value) is Fragment:
+                chunks.extend(value.template.iter_render(value.values))
+            else:
+                append(escape(value))
+            append(literal)
+        return Markup("".join(chunks))
+    
+    def iter_render(self, values: Dict[str, Any]) -> Iterator[str]:
+        """
+        テンプレートに値を差し込みながら断片を順に返す（全体を1つの文字列に結合しない）
+        
+        Args:
+            values: 差し込み名 → 値
+        
+        Yields:
+            str: HTML断片
+        """
+        yield self._head
+        for name, literal in self._slots:
+            value = values[name]
+            if type(value) is Markup:
+                yield value
+            elif type(value) is Fragment:
+                yield from value.template.iter_render(value.values)
+            else:
+                yield escape(value)
+            yield literal
+    
+    def iter_render_bytes(self, values: Dict[str, Any]) -> Iterator[bytes]:
+        """
+        iter_renderのUTF-8バイト列版（固定部分はエンコード済みのものを使い、差し込む値だけエンコードする）
+        
+        Args:
+            values: 差し込み名 → 値
+        
+        Yields:
+            bytes: HTML断片
+        """
+        yield self._head_bytes
+        for name, literal in self._slots_bytes:
+            value = values[name]
+            if type(value) is Markup:
+                yield value.encode("utf-8")
+            elif type(value) is Fragment:
+                yield from value.template.iter_render_bytes(value.values)
+            else:
+                yield escape(value).encode("utf-8")
+            yield literal
+
+
+@lru_cache(maxsize=None)
+def get_template(name: str) -> Template:
+    """
+    テンプレートを取得（プロセス内で1回だけ読み込む）
+    
+    ファイル末尾の改行は1つだけ取り除く（エディタが付ける改行を出力に含めないため）
+    
+    Args:
+        name: テンプレートファイル名（templates/ からの相対パス）
+    
+    Returns:
+        Template: 分解済みテンプレート
+    """
+    with open(os.path.join(TEMPLATE_DIR, name), encoding="utf-8") as f:
+        source = f.read()
+    if source.endswith("\n"):
+        source = source[:-1]
+    return Template(source)
@@ -0,0 +1,63 @@
+"""
+チャートデータに埋め込む値のテスト
+float32で格納した値が、ページのJSONでは元の値（小数2桁）に戻ることを確認する
+"""
+import json
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.charts.price_chart import PriceChart
+from src.charts.rate_chart import RateChart
+from src.fetchers.base_fetcher import BaseFetcher
+from src.renderer.html_generator import _dump_json
+
+
+def _trace_values(chart_data: dict) -> dict:
+    """
+    埋め込み用JSONを経由したtraceの値を取り出す
+
+    Args:
+        chart_data: create_multi_period_dataの結果
+
+    Returns:
+        dict: 期間 → trace名 → 値のリスト
+    """
+    loaded = json.loads(_dump_json(chart_data))
+    return {
+        period: {trace["name"]: trace["y"] for trace in data["traces"]}
+        for period, data in loaded.items()
+    }
+
+
+class ChartValuesRoundTripTest(unittest.TestCase):
+    """float32格納 → チャートデータ → JSON の往復"""
+
+    def test_price_values_round_trip(self):
+        index = pd.bdate_range(end=pd.Timestamp.now().normalize(), periods=300)
+        rng = np.random.default_rng(4)
+        close = np.round(4123.45 + np.cumsum(rng.normal(0.0, 20.0, index.size)), 2)
+        stored = BaseFetcher.build_float32_frame({'Close': close}, index)
+
+        values = _trace_values(PriceChart("米国", "S&P500").create_multi_period_data(stored, [1]))
+
+        # 期間で切り出した末尾部分がそのまま出力される
+        traced = values["1"]["株価"]
+        self.assertEqual(traced, close[-len(traced):].tolist())
+
+    def test_rate_values_round_trip(self):
+        index = pd.date_range(end=pd.Timestamp.now().normalize(), periods=24, freq="MS")
+        rates = np.round(np.linspace(2.57, 5.33, index.size), 2)
+        policy = BaseFetcher.build_float32_frame({'policy_rate': rates}, index)
+        long_rate = BaseFetcher.build_float32_frame({'long_rate_10y': rates + 1.0}, index)
+
+        values = _trace_values(RateChart("米国").create_multi_period_data(policy, long_rate, [5]))
+
+        traces = list(values["5"].values())
+        self.assertEqual(traces[0], rates.tolist())
+        self.assertEqual(traces[1], np.round(rates + 1.0, 2).tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
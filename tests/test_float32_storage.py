@@ -0,0 +1,95 @@
+"""
+float32格納の精度チェック
+株価・移動平均・金利をfloat32で格納しても、float64との相対誤差が1e-5未満に収まることを確認する
+"""
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from src.fetchers.price_fetcher import PRICE_DTYPES, PriceFetcher
+from src.fetchers.rate_fetcher import RateFetcher
+
+# 許容する相対誤差（最大絶対誤差 / 最大値）
+RELATIVE_TOLERANCE = 1e-5
+
+
+def _relative_error(f32: np.ndarray, f64: np.ndarray) -> float:
+    """
+    float32とfloat64の相対誤差を計算
+
+    Args:
+        f32: float32で格納した値
+        f64: float64の元の値
+
+    Returns:
+        float: abs(f32 - f64).max() / abs(f64).max()
+    """
+    return float(np.abs(f32.astype(np.float64) - f64).max() / np.abs(f64).max())
+
+
+def _random_walk(level: float, size: int, seed: int) -> np.ndarray:
+    """
+    指定水準付近のランダムウォーク（日次の終値を想定）
+
+    Args:
+        level: 初期値
+        size: 日数
+        seed: 乱数シード
+
+    Returns:
+        ndarray: float64の値
+    """
+    rng = np.random.default_rng(seed)
+    return level * np.exp(np.cumsum(rng.normal(0.0, 0.01, size)))
+
+
+class Float32PriceTest(unittest.TestCase):
+    """株価と移動平均のfloat32格納"""
+
+    def test_price_columns_within_tolerance(self):
+        # S&P500・日経平均の水準で、10年分の日足
+        index = pd.bdate_range(end="2026-01-30", periods=2600)
+        for level, seed in ((5000.0, 1), (40000.0, 2)):
+            close = pd.DataFrame({'Close': _random_walk(level, index.size, seed)}, index=index)
+            with mock.patch.object(PriceFetcher, "save_cache"):
+                stored = PriceFetcher._merge_and_cache(
+                    "TEST", None, close.copy(), index[0].to_pydatetime(), index[-1].to_pydatetime()
+                )
+
+            expected = close.copy()
+            for window in (20, 75, 200):
+                expected[f'MA{window}'] = close['Close'].rolling(window=window, min_periods=1).mean()
+
+            for column in PRICE_DTYPES:
+                with self.subTest(level=level, column=column):
+                    self.assertEqual(stored[column].dtype, np.float32)
+                    error = _relative_error(stored[column].to_numpy(), expected[column].to_numpy())
+                    self.assertLess(error, RELATIVE_TOLERANCE)
+
+
+class Float32RateTest(unittest.TestCase):
+    """金利のfloat32格納"""
+
+    def test_rate_within_tolerance(self):
+        index = pd.date_range(end="2026-01-30", periods=3650, freq="D")
+        rng = np.random.default_rng(3)
+        rates = pd.Series(np.clip(2.5 + np.cumsum(rng.normal(0.0, 0.02, index.size)), 0.0, None), index=index)
+
+        for rate_type, column in (("policy", "policy_rate"), ("long_10y", "long_rate_10y")):
+            # FREDクライアントを使わずに変換部分だけを確認する
+            fetcher = RateFetcher.__new__(RateFetcher)
+            fetcher.market_code = "US"
+            fetcher.rate_type = rate_type
+            with mock.patch.object(RateFetcher, "save_raw_data"):
+                stored = fetcher._to_frame(rates)
+
+            with self.subTest(rate_type=rate_type):
+                self.assertEqual(stored[column].dtype, np.float32)
+                error = _relative_error(stored[column].to_numpy(), rates.to_numpy())
+                self.assertLess(error, RELATIVE_TOLERANCE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+移動平均カーネルのテスト（pandasのrolling(min_periods=1).mean()と比較する）
+"""
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.fetchers.ma_kernels import rolling_mean_np, rolling_means, rolling_means_many
+
+WINDOWS = (20, 75, 200)
+
+
+def _expected(close: np.ndarray, window: int) -> np.ndarray:
+    """
+    pandasで計算した移動平均（min_periods=1）
+
+    Args:
+        close: 終値
+        window: ウィンドウ幅
+
+    Returns:
+        ndarray: 移動平均
+    """
+    return pd.Series(close).rolling(window=window, min_periods=1).mean().to_numpy()
+
+
+class RollingMeansTest(unittest.TestCase):
+    """MA20/MA75/MA200の計算"""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.close = 5000.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, 2600)))
+
+    def test_rolling_means_matches_pandas(self):
+        means = rolling_means(self.close)
+        for window in WINDOWS:
+            with self.subTest(window=window):
+                np.testing.assert_allclose(means[f'MA{window}'], _expected(self.close, window), rtol=1e-9)
+
+    def test_single_window_matches_pandas(self):
+        for window in WINDOWS:
+            with self.subTest(window=window):
+                np.testing.assert_allclose(rolling_mean_np(self.close, window), _expected(self.close, window), rtol=1e-9)
+
+    def test_shorter_than_window(self):
+        close = self.close[:50]
+        means = rolling_means(close)
+        for window in WINDOWS:
+            with self.subTest(window=window):
+                self.assertEqual(means[f'MA{window}'].size, close.size)
+                np.testing.assert_allclose(means[f'MA{window}'], _expected(close, window), rtol=1e-9)
+
+    def test_many_with_uneven_lengths(self):
+        closes = [self.close, self.close[-1000:] * 8.0, self.close[:30]]
+        for close, means in zip(closes, rolling_means_many(closes)):
+            for window in WINDOWS:
+                with self.subTest(size=close.size, window=window):
+                    np.testing.assert_allclose(means[f'MA{window}'], _expected(close, window), rtol=1e-9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+株価の差分取得（キャッシュとの結合）のテスト
+"""
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.fetchers.ma_kernels import rolling_means
+from src.fetchers.price_fetcher import PriceFetcher
+
+
+def _cached_frame(close: pd.Series) -> pd.DataFrame:
+    """
+    キャッシュ相当のデータ（Closeと移動平均、float32）を作る
+
+    Args:
+        close: 終値
+
+    Returns:
+        DataFrame: Close, MA20, MA75, MA200
+    """
+    df = close.to_frame('Close')
+    for name, values in rolling_means(close.to_numpy()).items():
+        df[name] = values
+    return df.astype('float32')
+
+
+class DeltaFetchTest(unittest.TestCase):
+    """差分取得の開始日と結合"""
+
+    def setUp(self):
+        self.index = pd.bdate_range(end="2026-01-30", periods=300)
+        self.close = pd.Series(np.linspace(100.0, 130.0, self.index.size), index=self.index)
+        self.cached = _cached_frame(self.close)
+
+    def test_download_start_includes_last_cached_bar(self):
+        # 取引時間中に保存された最終日の終値を取り直すため、最終日から取得する
+        start = PriceFetcher._download_start(
+            self.cached, self.index[0].to_pydatetime(), self.index[-1].to_pydatetime()
+        )
+        self.assertEqual(pd.Timestamp(start), self.index[-1])
+
+    def test_splice_overwrites_overlapping_bar(self):
+        next_day = self.index[-1] + pd.offsets.BDay()
+        new = pd.DataFrame({'Close': [140.0, 141.0]}, index=pd.DatetimeIndex([self.index[-1], next_day]))
+
+        spliced = PriceFetcher._splice(self.cached, new)
+
+        self.assertEqual(len(spliced), self.index.size + 1)
+        self.assertEqual(spliced['Close'].iloc[-2], 140.0)
+        self.assertEqual(spliced['Close'].iloc[-1], 141.0)
+
+        # 差し込んだ移動平均は全期間で計算し直した値と一致する
+        expected_close = pd.concat([self.close.iloc[:-1], new['Close']])
+        for window in (20, 75, 200):
+            expected = expected_close.rolling(window=window, min_periods=1).mean()
+            np.testing.assert_allclose(
+                spliced[f'MA{window}'].to_numpy()[-5:], expected.to_numpy()[-5:], rtol=1e-6
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()